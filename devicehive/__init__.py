@@ -14,14 +14,25 @@
 # =============================================================================
 
 
+import sys
 from .handler import Handler
 from .device_hive import DeviceHive
 from .device_hive_api import DeviceHiveApi
+from .sharded_device_hive_api import ShardedDeviceHiveApi
+from .device_hive_supervisor import DeviceHiveSupervisor
 from .transports.transport import TransportError
 from .api_request import ApiRequestError
+from .api_pipeline import ApiPipelineError
+from .api_dispatcher import ApiDispatcherError
+from .api_gateway import ApiGatewayError
 from .api_response import ApiResponseError
+from .api_command_futures import ApiCommandFuturesError
+from .notification_publisher import NotificationPublisherError
 from .device import DeviceError
 from .network import NetworkError
 from .device_type import DeviceTypeError
 from .subscription import SubscriptionError
 from .user import UserError
+if sys.version_info >= (3, 5):
+    from .async_handler import AsyncHandler
+    from .async_device_hive import AsyncDeviceHive
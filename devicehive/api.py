@@ -18,6 +18,18 @@ from devicehive.token import Token
 from devicehive.api_request import ApiRequest
 from devicehive.api_request import AuthApiRequest
 from devicehive.api_request import AuthSubscriptionApiRequest
+from devicehive.api_pipeline import ApiPipeline
+from devicehive.api_pager import ApiPager
+from devicehive.api_backfill import ApiBackfill
+from devicehive.api_cache import ApiCache
+from devicehive.api_single_flight import ApiSingleFlight
+from devicehive.api_outbox import ApiOutbox
+from devicehive.api_command_futures import ApiCommandFutures
+from devicehive.api_gateway import ApiGateway
+from devicehive.notification_publisher import NotificationPublisher
+from devicehive.api_request import ApiRequestError
+from devicehive.api_response import ApiResponseError
+from devicehive.transports.transport import TransportError
 from devicehive.device import Device
 from devicehive.command import Command
 from devicehive.notification import Notification
@@ -26,14 +38,27 @@ from devicehive.subscription import CommandsSubscription, \
 from devicehive.network import Network
 from devicehive.device_type import DeviceType
 from devicehive.user import User
+import threading
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class Api(object):
     """Api class."""
 
-    def __init__(self, transport, auth):
+    def __init__(self, transport, auth, cache_options=None,
+                 outbox_options=None):
         self._transport = transport
         self._token = Token(self, auth)
+        self._cache = ApiCache(**cache_options) if cache_options else None
+        self._single_flight = ApiSingleFlight()
+        self._command_futures = ApiCommandFutures(self)
+        self._gateway = ApiGateway(self)
+        self._outbox = ApiOutbox(**outbox_options) if outbox_options else None
+        self._outbox_lock = threading.Lock()
+        self._outbox_thread = None
         self._connected = True
         self._subscriptions = set()
         self.server_timestamp = None
@@ -128,6 +153,118 @@ class Api(object):
         api_request.subscription_request(auth_subscription_api_request)
         return api_request.execute('Subscribe notifications failure.')
 
+    def _outbox_request(self, action, request):
+        if action == ApiOutbox.NOTIFICATION_ACTION:
+            return self._send_notification(**request)
+        if action == ApiOutbox.COMMAND_UPDATE_ACTION:
+            return Command.update(self, **request)
+
+    def _outbox_batch(self, batch):
+        with self.pipeline(self._outbox.window) as api_pipeline:
+            futures = [(row_id, api_pipeline.submit(self._outbox_request,
+                                                    action, request))
+                       for row_id, action, request in batch]
+        row_ids = []
+        poisoned_row_ids = []
+        for row_id, future in futures:
+            exception = future.exception()
+            if isinstance(exception, TransportError):
+                continue
+            if isinstance(exception, (ApiRequestError, ApiResponseError)):
+                logger.warning('Outbox request rejected: %s', exception)
+            elif exception:
+                logger.error('Outbox request poisoned: %r', exception)
+                poisoned_row_ids.append(row_id)
+                continue
+            row_ids.append(row_id)
+        self._outbox.remove(row_ids)
+        self._outbox.drop(poisoned_row_ids)
+        return len(row_ids) + len(poisoned_row_ids) == len(batch)
+
+    def _drain_outbox(self):
+        try:
+            while self._transport.connected:
+                batch = self._outbox.batch()
+                if not batch:
+                    with self._outbox_lock:
+                        if not len(self._outbox):
+                            self._outbox_thread = None
+                            return
+                    continue
+                if not self._outbox_batch(batch):
+                    break
+        except Exception:
+            logger.warning('Outbox drain failure.', exc_info=True)
+        with self._outbox_lock:
+            self._outbox_thread = None
+
+    @property
+    def command_futures(self):
+        return self._command_futures
+
+    @property
+    def gateway(self):
+        return self._gateway
+
+    @property
+    def outbox(self):
+        return self._outbox
+
+    def drain_outbox(self):
+        if self._outbox is None:
+            return
+        with self._outbox_lock:
+            if self._outbox_thread:
+                return
+            self._outbox_thread = threading.Thread(target=self._drain_outbox)
+            self._outbox_thread.name = 'api-outbox'
+            self._outbox_thread.daemon = True
+            self._outbox_thread.start()
+
+    def outbox_call(self, action, request, call, *args):
+        if self._outbox is None:
+            return call(*args)
+        if self._transport.connected and not len(self._outbox):
+            try:
+                return call(*args)
+            except (ApiRequestError, ApiResponseError):
+                raise
+            except TransportError:
+                pass
+        self._outbox.put(action, request)
+        if self._transport.connected:
+            self.drain_outbox()
+
+    @property
+    def single_flight(self):
+        return self._single_flight
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def cache_call(self, entity_type, entity_id, call, *args):
+        if not self._cache:
+            return call(*args)
+        return self._cache.load((entity_type, entity_id), call, *args)
+
+    def invalidate_cache(self, entity_type, entity_id):
+        if not self._cache:
+            return
+        self._cache.invalidate((entity_type, entity_id))
+
+    def _subscription_network_ids(self, device_id, network_ids):
+        if not device_id or network_ids:
+            return network_ids
+        if self._transport.name != 'http':
+            return network_ids
+        if not self._transport.subscription_coalescing:
+            return network_ids
+        network_id = self.get_device(device_id).network_id
+        if network_id is None:
+            return network_ids
+        return [network_id]
+
     def _add_subscription(self, subscription):
         if subscription in self._subscriptions:
             return
@@ -154,6 +291,15 @@ class Api(object):
     def connected(self):
         return self._connected
 
+    def pipeline(self, window=16):
+        return ApiPipeline(self, window)
+
+    def notification_publisher(self, window=1.0, max_count=100,
+                               mode=NotificationPublisher.AGGREGATE_MODE,
+                               pipeline_window=16):
+        return NotificationPublisher(self, window, max_count, mode,
+                                     pipeline_window)
+
     def get_info(self):
         api_request = ApiRequest(self)
         api_request.url('info')
@@ -228,6 +374,8 @@ class Api(object):
     def subscribe_insert_commands(self, device_id=None, network_ids=(),
                                   device_type_ids=(), names=(), timestamp=None):
         call = self._subscribe_insert_commands
+        network_ids = self._subscription_network_ids(device_id,
+                                                     network_ids)
         args = (device_id, network_ids, device_type_ids, names, timestamp)
         commands_subscription = CommandsSubscription(self, call, args)
         commands_subscription.subscribe()
@@ -238,6 +386,8 @@ class Api(object):
                                   device_type_ids=(), names=(),
                                   timestamp=None):
         call = self._subscribe_update_commands
+        network_ids = self._subscription_network_ids(device_id,
+                                                     network_ids)
         args = (device_id, network_ids, device_type_ids, names, timestamp)
         commands_subscription = CommandsSubscription(self, call, args)
         commands_subscription.subscribe()
@@ -248,6 +398,8 @@ class Api(object):
                                 device_type_ids=(), names=(),
                                 timestamp=None):
         call = self._subscribe_notifications
+        network_ids = self._subscription_network_ids(device_id,
+                                                     network_ids)
         args = (device_id, network_ids, device_type_ids, names, timestamp)
         notifications_subscription = NotificationsSubscription(self, call, args)
         notifications_subscription.subscribe()
@@ -272,6 +424,14 @@ class Api(object):
         devices = auth_api_request.execute('List devices failure.')
         return [Device(self, device) for device in devices]
 
+    def iter_devices(self, name=None, name_pattern=None, network_id=None,
+                     network_name=None, sort_field=None, sort_order=None,
+                     page_size=100, prefetch=1):
+        return ApiPager(self.list_devices, page_size, prefetch, name=name,
+                        name_pattern=name_pattern, network_id=network_id,
+                        network_name=network_name, sort_field=sort_field,
+                        sort_order=sort_order)
+
     def get_device(self, device_id):
         device = Device(self)
         device.get(device_id)
@@ -310,8 +470,24 @@ class Api(object):
         commands = auth_api_request.execute('List commands failure.')
         return [Command(self, command) for command in commands]
 
-    def send_command(self, device_id, command_name, parameters=None,
-                     lifetime=None, timestamp=None, status=None, result=None):
+    def iter_commands(self, device_id, start=None, end=None, command=None,
+                      status=None, sort_field=None, sort_order=None,
+                      page_size=100, prefetch=1):
+        return ApiPager(self.list_commands, page_size, prefetch,
+                        device_id=device_id, start=start, end=end,
+                        command=command, status=status, sort_field=sort_field,
+                        sort_order=sort_order)
+
+    def backfill_commands(self, device_ids, start, end, command=None,
+                          status=None, num_shards=16, concurrency=8,
+                          page_size=1000):
+        return ApiBackfill(self.list_commands, device_ids, start, end,
+                           num_shards, concurrency, page_size, command=command,
+                           status=status)
+
+    def _send_command(self, device_id, command_name, parameters=None,
+                      lifetime=None, timestamp=None, status=None,
+                      result=None):
         command = {Command.COMMAND_KEY: command_name}
         if parameters:
             command[Command.PARAMETERS_KEY] = parameters
@@ -338,6 +514,25 @@ class Api(object):
         command[Command.RESULT_KEY] = result
         return Command(self, command)
 
+    def send_command(self, device_id, command_name, parameters=None,
+                     lifetime=None, timestamp=None, status=None, result=None,
+                     wait=False, timeout=None):
+        if not wait:
+            return self._send_command(device_id, command_name, parameters,
+                                      lifetime, timestamp, status, result)
+        future = self.send_command_future(device_id, command_name,
+                                          parameters, lifetime, timestamp,
+                                          status, result)
+        return self._command_futures.wait(future, timeout)
+
+    def send_command_future(self, device_id, command_name, parameters=None,
+                            lifetime=None, timestamp=None, status=None,
+                            result=None):
+        self._command_futures.subscribe()
+        command = self._send_command(device_id, command_name, parameters,
+                                     lifetime, timestamp, status, result)
+        return self._command_futures.future(command.id)
+
     def list_notifications(self, device_id, start=None, end=None,
                            notification=None, sort_field=None, sort_order=None,
                            take=None, skip=None):
@@ -356,8 +551,23 @@ class Api(object):
         notifications = auth_api_request.execute('List notifications failure.')
         return [Notification(notification) for notification in notifications]
 
-    def send_notification(self, device_id, notification_name, parameters=None,
-                          timestamp=None):
+    def iter_notifications(self, device_id, start=None, end=None,
+                           notification=None, sort_field=None, sort_order=None,
+                           page_size=100, prefetch=1):
+        return ApiPager(self.list_notifications, page_size, prefetch,
+                        device_id=device_id, start=start, end=end,
+                        notification=notification, sort_field=sort_field,
+                        sort_order=sort_order)
+
+    def backfill_notifications(self, device_ids, start, end,
+                               notification=None, num_shards=16,
+                               concurrency=8, page_size=1000):
+        return ApiBackfill(self.list_notifications, device_ids, start, end,
+                           num_shards, concurrency, page_size,
+                           notification=notification)
+
+    def _send_notification(self, device_id, notification_name, parameters=None,
+                           timestamp=None):
         notification = {'notification': notification_name}
         if parameters:
             notification['parameters'] = parameters
@@ -376,6 +586,45 @@ class Api(object):
         notification[Notification.PARAMETERS_KEY] = parameters
         return Notification(notification)
 
+    def send_notification(self, device_id, notification_name, parameters=None,
+                          timestamp=None):
+        request = {'device_id': device_id,
+                   'notification_name': notification_name,
+                   'parameters': parameters,
+                   'timestamp': timestamp}
+        if self._outbox is not None and not timestamp:
+            request['timestamp'] = self._outbox.timestamp()
+        notification = self.outbox_call(ApiOutbox.NOTIFICATION_ACTION, request,
+                                        self._send_notification, device_id,
+                                        notification_name, parameters,
+                                        timestamp)
+        if notification is not None:
+            return notification
+        return Notification({Notification.DEVICE_ID_KEY: device_id,
+                             Notification.ID_KEY: None,
+                             Notification.NOTIFICATION_KEY: notification_name,
+                             Notification.PARAMETERS_KEY: parameters,
+                             Notification.TIMESTAMP_KEY: request['timestamp']})
+
+    def send_notifications(self, device_id, notifications, window=16):
+        with self.pipeline(window) as api_pipeline:
+            return [api_pipeline.submit(
+                self.send_notification, device_id,
+                notification[Notification.NOTIFICATION_KEY],
+                notification.get(Notification.PARAMETERS_KEY),
+                notification.get(Notification.TIMESTAMP_KEY))
+                for notification in notifications]
+
+    def send_bulk_notifications(self, notifications, window=16):
+        with self.pipeline(window) as api_pipeline:
+            return [api_pipeline.submit(
+                self.send_notification,
+                notification[Notification.DEVICE_ID_KEY],
+                notification[Notification.NOTIFICATION_KEY],
+                notification.get(Notification.PARAMETERS_KEY),
+                notification.get(Notification.TIMESTAMP_KEY))
+                for notification in notifications]
+
     def list_networks(self, name=None, name_pattern=None, sort_field=None,
                       sort_order=None, take=None, skip=None):
         auth_api_request = AuthApiRequest(self)
@@ -391,6 +640,12 @@ class Api(object):
         networks = auth_api_request.execute('List networks failure.')
         return [Network(self, network) for network in networks]
 
+    def iter_networks(self, name=None, name_pattern=None, sort_field=None,
+                      sort_order=None, page_size=100, prefetch=1):
+        return ApiPager(self.list_networks, page_size, prefetch, name=name,
+                        name_pattern=name_pattern, sort_field=sort_field,
+                        sort_order=sort_order)
+
     def get_network(self, network_id):
         network = Network(self)
         network.get(network_id)
@@ -424,6 +679,12 @@ class Api(object):
         device_types = auth_api_request.execute('List device types failure.')
         return [DeviceType(self, device_type) for device_type in device_types]
 
+    def iter_device_types(self, name=None, name_pattern=None, sort_field=None,
+                          sort_order=None, page_size=100, prefetch=1):
+        return ApiPager(self.list_device_types, page_size, prefetch, name=name,
+                        name_pattern=name_pattern, sort_field=sort_field,
+                        sort_order=sort_order)
+
     def get_device_type(self, device_type_id):
         device_type = DeviceType(self)
         device_type.get(device_type_id)
@@ -460,6 +721,13 @@ class Api(object):
         users = auth_api_request.execute('List users failure.')
         return [User(self, user) for user in users]
 
+    def iter_users(self, login=None, login_pattern=None, role=None, status=None,
+                   sort_field=None, sort_order=None, page_size=100,
+                   prefetch=1):
+        return ApiPager(self.list_users, page_size, prefetch, login=login,
+                        login_pattern=login_pattern, role=role, status=status,
+                        sort_field=sort_field, sort_order=sort_order)
+
     def get_current_user(self):
         user = User(self)
         user.get_current()
@@ -494,6 +762,8 @@ class Api(object):
 
     def disconnect(self):
         self._connected = False
-        if not self._transport.connected:
-            return
-        self._transport.disconnect()
+        self._token.cancel_refresh()
+        if self._transport.connected:
+            self._transport.disconnect()
+        if self._outbox is not None:
+            self._outbox.close()
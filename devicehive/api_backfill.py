@@ -0,0 +1,135 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.timestamps import format_timestamp, parse_timestamp
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import datetime
+import heapq
+import six
+
+
+class ApiBackfill(object):
+    """Api backfill class."""
+
+    def __init__(self, call, device_ids, start, end, num_shards=16,
+                 concurrency=8, page_size=1000, **kwargs):
+        assert num_shards > 0, 'Number of shards must be positive'
+        assert concurrency > 0, 'Concurrency must be positive'
+        if isinstance(device_ids, six.string_types):
+            device_ids = [device_ids]
+        self._call = call
+        self._device_ids = list(device_ids)
+        self._start = self._datetime(start)
+        self._end = self._datetime(end)
+        assert self._start <= self._end, 'Start must not be after end'
+        self._num_shards = num_shards
+        self._concurrency = concurrency
+        self._page_size = page_size
+        self._kwargs = kwargs
+
+    def __iter__(self):
+        executor = ThreadPoolExecutor(self._concurrency)
+        tasks = iter([(index, device_id, start, end, last)
+                      for index, (start, end, last)
+                      in enumerate(self._time_shards())
+                      for device_id in self._device_ids])
+        max_shards = max(2 * self._concurrency, len(self._device_ids))
+        shards = deque()
+        slice_shards = []
+        try:
+            self._submit_shards(executor, tasks, shards, max_shards)
+            while shards:
+                index = shards[0][0]
+                slice_shards = []
+                while shards and shards[0][0] == index:
+                    slice_shards.append(shards.popleft())
+                self._submit_shards(executor, tasks, shards, max_shards)
+                for _, _, item in heapq.merge(*[items for _, _, items
+                                                in slice_shards]):
+                    yield item
+        finally:
+            for _, page, items in slice_shards + list(shards):
+                items.close()
+                page.cancel()
+            executor.shutdown(False)
+
+    def _submit_shards(self, executor, tasks, shards, max_shards):
+        while len(shards) < max_shards:
+            task = next(tasks, None)
+            if not task:
+                return
+            index, device_id, start, end, last = task
+            page = executor.submit(self._page, device_id, start, end, 0)
+            shards.append((index, page,
+                           self._shard(executor, page, device_id, start, end,
+                                       last)))
+
+    @staticmethod
+    def _datetime(timestamp):
+        if isinstance(timestamp, datetime):
+            return timestamp
+        return parse_timestamp(timestamp)
+
+    def _time_shards(self):
+        interval = (self._end - self._start) // self._num_shards
+        bounds = [format_timestamp(self._start + interval * index)
+                  for index in range(self._num_shards)]
+        bounds.append(format_timestamp(self._end))
+        bounds = [bound for index, bound in enumerate(bounds)
+                  if not index or bound != bounds[index - 1]]
+        if len(bounds) == 1:
+            bounds.append(bounds[0])
+        return [(start, end, index == len(bounds) - 2)
+                for index, (start, end) in enumerate(zip(bounds, bounds[1:]))]
+
+    def _page(self, device_id, start, end, skip):
+        return self._call(device_id=device_id, start=start, end=end,
+                          sort_field='timestamp', sort_order='ASC',
+                          take=self._page_size, skip=skip, **self._kwargs)
+
+    def _shard(self, executor, page, device_id, start, end, last):
+        skip = 0
+        try:
+            while page:
+                items = page.result()
+                skip += self._page_size
+                page = None
+                if len(items) == self._page_size:
+                    page = executor.submit(self._page, device_id, start, end,
+                                           skip)
+                for item in items:
+                    if start <= item.timestamp[:len(end)] < end or \
+                            last and item.timestamp[:len(end)] == end:
+                        yield item.timestamp, item.id, item
+        finally:
+            if page:
+                page.cancel()
+
+    @property
+    def num_shards(self):
+        return self._num_shards
+
+    @property
+    def concurrency(self):
+        return self._concurrency
+
+    def run(self, sink):
+        num_items = 0
+        for item in self:
+            sink(item)
+            num_items += 1
+        return num_items
@@ -0,0 +1,90 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from collections import OrderedDict
+import threading
+import copy
+import time
+
+
+class ApiCache(object):
+    """Api cache class."""
+
+    def __init__(self, max_size=1024, ttl=60):
+        assert max_size > 0, 'Cache max size must be positive'
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._num_invalidations = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry and (entry[1] is None or entry[1] > time.time()):
+                self._entries[key] = entry
+                self._hits += 1
+                return True, entry[0]
+            self._misses += 1
+            return False, self._num_invalidations
+
+    def _set(self, key, value, num_invalidations):
+        with self._lock:
+            if num_invalidations != self._num_invalidations:
+                return
+            expiration_time = time.time() + self._ttl if self._ttl else None
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expiration_time)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {'hits': self._hits,
+                    'misses': self._misses,
+                    'evictions': self._evictions,
+                    'size': len(self._entries)}
+
+    def load(self, key, call, *args):
+        found, value = self._get(key)
+        if not found:
+            num_invalidations = value
+            value = call(*args)
+            self._set(key, value, num_invalidations)
+        return copy.deepcopy(value)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._num_invalidations += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._num_invalidations += 1
+            self._entries.clear()
@@ -0,0 +1,106 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.api_request import ApiRequestError
+from concurrent.futures import Future, TimeoutError
+import collections
+import threading
+
+
+class ApiCommandFutures(object):
+    """Api command futures class."""
+
+    def __init__(self, api, max_unmatched=1024):
+        self._api = api
+        self._max_unmatched = max_unmatched
+        self._subscription = None
+        self._subscribe_lock = threading.Lock()
+        self._futures = {}
+        self._unmatched = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._num_resolved = 0
+        self._num_timeouts = 0
+
+    def _remove_future(self, command_id, future):
+        with self._lock:
+            if self._futures.get(command_id) is future:
+                del self._futures[command_id]
+
+    @property
+    def subscription(self):
+        return self._subscription
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {'pending': len(self._futures),
+                    'resolved': self._num_resolved,
+                    'timeouts': self._num_timeouts,
+                    'unmatched': len(self._unmatched)}
+
+    def subscribe(self):
+        with self._subscribe_lock:
+            if self._subscription:
+                return
+            timestamp = self._api.get_info()['server_timestamp']
+            self._subscription = self._api.subscribe_update_commands(
+                timestamp=timestamp)
+            self._subscription.clear_timestamp()
+
+    def future(self, command_id):
+        future = Future()
+        with self._lock:
+            command = self._unmatched.pop(command_id, None)
+            if command is None:
+                self._futures[command_id] = future
+        if command is not None:
+            future.set_result(command)
+            return future
+        future.add_done_callback(
+            lambda done_future: self._remove_future(command_id, done_future))
+        return future
+
+    def wait(self, future, timeout=None):
+        if self._api.transport.in_connection_thread():
+            future.cancel()
+            raise ApiCommandFuturesError('Command update can not be waited '
+                                         'in the connection thread.')
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._num_timeouts += 1
+            raise ApiCommandFuturesError('Command update wait timeout.')
+
+    def handle_command_update(self, subscription_id, command):
+        if not self._subscription or self._subscription.id != subscription_id:
+            return False
+        with self._lock:
+            future = self._futures.pop(command.id, None)
+            if future is None:
+                self._unmatched[command.id] = command
+                if len(self._unmatched) > self._max_unmatched:
+                    self._unmatched.popitem(False)
+                return True
+            self._num_resolved += 1
+        if future.set_running_or_notify_cancel():
+            future.set_result(command)
+        return True
+
+
+class ApiCommandFuturesError(ApiRequestError):
+    """Api command futures error."""
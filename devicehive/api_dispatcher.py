@@ -0,0 +1,103 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.api_request import ApiRequestError
+from devicehive.transports.event_queue import EventQueue
+import threading
+import logging
+import zlib
+import six
+
+
+logger = logging.getLogger(__name__)
+
+
+class ApiDispatcher(object):
+    """Api dispatcher class."""
+
+    def __init__(self, num_workers=8, queue_max_size=0,
+                 queue_overflow_policy=EventQueue.BLOCK_OVERFLOW_POLICY):
+        assert num_workers > 0, 'Dispatcher must have at least one worker'
+        self._queues = [EventQueue(queue_max_size, queue_overflow_policy)
+                        for _ in range(num_workers)]
+        self._num_processed = [0] * num_workers
+        self._num_errors = [0] * num_workers
+        self._closed = False
+        self._threads = []
+        for shard in range(num_workers):
+            thread = threading.Thread(target=self._worker, args=(shard,))
+            thread.name = 'api-dispatcher-%s' % shard
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _shard(self, key):
+        if key is None:
+            return 0
+        if not isinstance(key, six.binary_type):
+            key = six.text_type(key).encode('utf-8')
+        return zlib.crc32(key) % len(self._queues)
+
+    def _worker(self, shard):
+        events_queue = self._queues[shard]
+        while True:
+            item = events_queue.get()
+            if item is None:
+                if self._closed:
+                    return
+                continue
+            call, args = item
+            try:
+                call(*args)
+            except Exception:
+                self._num_errors[shard] += 1
+                logger.exception('Event handling failure.')
+            self._num_processed[shard] += 1
+
+    @property
+    def num_workers(self):
+        return len(self._queues)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def stats(self):
+        return [{'size': len(events_queue),
+                 'processed': self._num_processed[shard],
+                 'dropped': events_queue.num_dropped,
+                 'errors': self._num_errors[shard]}
+                for shard, events_queue in enumerate(self._queues)]
+
+    def submit(self, key, call, *args):
+        if self._closed:
+            raise ApiDispatcherError('Dispatcher is closed.')
+        return self._queues[self._shard(key)].put((call, args))
+
+    def close(self):
+        self._closed = True
+        for events_queue in self._queues:
+            events_queue.interrupt()
+
+    def join(self, timeout=None):
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+
+class ApiDispatcherError(ApiRequestError):
+    """Api dispatcher error."""
@@ -0,0 +1,136 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.api_request import ApiRequestError
+import collections
+import threading
+import six
+
+
+class ApiGateway(object):
+    """Api gateway class."""
+
+    def __init__(self, api, max_recent_commands=1024):
+        self._api = api
+        self._max_recent_commands = max_recent_commands
+        self._device_handlers = {}
+        self._devices = {}
+        self._network_ids = set()
+        self._subscription = None
+        self._previous_subscription_ids = set()
+        self._subscription_lock = threading.Lock()
+        self._recent_command_ids = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._num_commands = 0
+        self._num_unknown_commands = 0
+
+    def _subscribe(self, network_ids):
+        with self._subscription_lock:
+            if network_ids <= self._network_ids:
+                return
+            network_ids |= self._network_ids
+            timestamp = None
+            if self._subscription:
+                timestamp = self._api.get_info()['server_timestamp']
+            subscription = self._api.subscribe_insert_commands(
+                network_ids=sorted(network_ids), timestamp=timestamp)
+            subscription.clear_timestamp()
+            previous_subscription = self._subscription
+            self._subscription = subscription
+            self._network_ids = network_ids
+        if previous_subscription:
+            self._previous_subscription_ids.add(previous_subscription.id)
+            previous_subscription.remove()
+
+    def _recent_command(self, command_id):
+        with self._lock:
+            if command_id in self._recent_command_ids:
+                return True
+            self._recent_command_ids[command_id] = True
+            if len(self._recent_command_ids) > self._max_recent_commands:
+                self._recent_command_ids.popitem(False)
+            return False
+
+    @property
+    def subscription(self):
+        return self._subscription
+
+    @property
+    def network_ids(self):
+        return sorted(self._network_ids)
+
+    @property
+    def devices(self):
+        return dict(self._devices)
+
+    @property
+    def stats(self):
+        return {'devices': len(self._device_handlers),
+                'networks': len(self._network_ids),
+                'commands': self._num_commands,
+                'unknown_commands': self._num_unknown_commands}
+
+    def register(self, device_handlers, network_id=None, device_type_id=None,
+                 window=16):
+        device_handlers = dict(device_handlers)
+        self._device_handlers.update(device_handlers)
+        with self._api.pipeline(window) as api_pipeline:
+            futures = [(device_id, api_pipeline.submit(
+                self._api.put_device, device_id, network_id=network_id,
+                device_type_id=device_type_id))
+                for device_id in device_handlers]
+        failed_device_ids = []
+        network_ids = set()
+        for device_id, future in futures:
+            if future.exception():
+                failed_device_ids.append(device_id)
+                self._device_handlers.pop(device_id, None)
+                continue
+            device = future.result()
+            self._devices[device_id] = device
+            network_ids.add(device.network_id)
+        if network_ids:
+            self._subscribe(network_ids)
+        if failed_device_ids:
+            raise ApiGatewayError('Devices registration failure: %s.' %
+                                  ', '.join(map(six.text_type,
+                                                failed_device_ids)))
+
+    def unregister(self, device_ids):
+        for device_id in device_ids:
+            self._device_handlers.pop(device_id, None)
+            self._devices.pop(device_id, None)
+
+    def subscribed(self, subscription_id):
+        if not self._subscription:
+            return False
+        if self._subscription.id == subscription_id:
+            return True
+        return subscription_id in self._previous_subscription_ids
+
+    def device_handler(self, command):
+        device_handler = self._device_handlers.get(command.device_id)
+        if device_handler is None:
+            self._num_unknown_commands += 1
+            return None
+        if self._recent_command(command.id):
+            return None
+        self._num_commands += 1
+        return device_handler
+
+
+class ApiGatewayError(ApiRequestError):
+    """Api gateway error."""
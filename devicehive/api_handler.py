@@ -16,7 +16,7 @@
 
 from devicehive.handlers.handler import Handler
 from devicehive.api import Api
-from devicehive.api_event import ApiEvent
+from devicehive.api_dispatcher import ApiDispatcher
 from devicehive.command import Command
 from devicehive.notification import Notification
 
@@ -24,6 +24,8 @@ from devicehive.notification import Notification
 class ApiHandler(Handler):
     """Api handler class."""
 
+    EVENT_ACTION_KEY = 'action'
+    EVENT_SUBSCRIPTION_ID_KEY = 'subscriptionId'
     EVENT_COMMAND_INSERT_ACTION = 'command/insert'
     EVENT_COMMAND_UPDATE_ACTION = 'command/update'
     EVENT_COMMAND_KEY = 'command'
@@ -31,41 +33,90 @@ class ApiHandler(Handler):
     EVENT_NOTIFICATION_KEY = 'notification'
 
     def __init__(self, transport, auth, handler_class, handler_args,
-                 handler_kwargs, api_init):
+                 handler_kwargs, api_init, cache_options=None,
+                 outbox_options=None, dispatcher_options=None):
         super(ApiHandler, self).__init__(transport)
-        self._api = Api(self._transport, auth)
+        self._api = Api(self._transport, auth, cache_options, outbox_options)
         self._handler = handler_class(self._api, *handler_args,
                                       **handler_kwargs)
         self._api_init = api_init
         self._handle_connect = False
+        self._handle_event_calls = {
+            self.EVENT_COMMAND_INSERT_ACTION: self._handle_command_insert,
+            self.EVENT_COMMAND_UPDATE_ACTION: self._handle_command_update,
+            self.EVENT_NOTIFICATION_ACTION: self._handle_notification}
+        self._dispatcher = None
+        if dispatcher_options:
+            self._dispatcher = ApiDispatcher(**dispatcher_options)
+
+    def _dispatch(self, device_id, call, *args):
+        if self._dispatcher is None:
+            return call(*args)
+        self._dispatcher.submit(device_id, call, *args)
 
     @property
     def handler(self):
         return self._handler
 
+    @property
+    def dispatcher(self):
+        return self._dispatcher
+
     def handle_connect(self):
         self._api.token.auth()
         if self._api_init:
             server_timestamp = self._api.get_info()['server_timestamp']
             self._api.server_timestamp = server_timestamp
         self._api.apply_subscription_calls()
+        self._api.drain_outbox()
         if not self._handle_connect:
             self._handle_connect = True
             self._handler.handle_connect()
 
+    def _route(self, device_id, action, name, handle_call, event):
+        router = self._handler.router
+        route = router.route(action, name)
+        if route is None:
+            return self._dispatch(device_id, handle_call, event)
+        return self._dispatch(device_id, router.call, route, event)
+
+    def _handle_command_insert(self, event):
+        command = Command(self._api, event[self.EVENT_COMMAND_KEY])
+        gateway = self._api.gateway
+        if gateway.subscribed(event.get(self.EVENT_SUBSCRIPTION_ID_KEY)):
+            device_handler = gateway.device_handler(command)
+            if device_handler is None:
+                return
+            return self._dispatch(command.device_id,
+                                  device_handler.handle_command_insert, command)
+        return self._route(command.device_id, self.EVENT_COMMAND_INSERT_ACTION,
+                           command.command,
+                           self._handler.handle_command_insert, command)
+
+    def _handle_command_update(self, event):
+        command = Command(self._api, event[self.EVENT_COMMAND_KEY])
+        command_futures = self._api.command_futures
+        subscription_id = event.get(self.EVENT_SUBSCRIPTION_ID_KEY)
+        if command_futures.handle_command_update(subscription_id, command):
+            return
+        return self._route(command.device_id, self.EVENT_COMMAND_UPDATE_ACTION,
+                           command.command,
+                           self._handler.handle_command_update, command)
+
+    def _handle_notification(self, event):
+        notification = Notification(event[self.EVENT_NOTIFICATION_KEY])
+        return self._route(notification.device_id,
+                           self.EVENT_NOTIFICATION_ACTION,
+                           notification.notification,
+                           self._handler.handle_notification, notification)
+
     def handle_event(self, event):
-        api_event = ApiEvent(event)
-        action = api_event.action
-        event = api_event.event
-        if action == self.EVENT_COMMAND_INSERT_ACTION:
-            command = Command(self._api, event[self.EVENT_COMMAND_KEY])
-            return self._handler.handle_command_insert(command)
-        if action == self.EVENT_COMMAND_UPDATE_ACTION:
-            command = Command(self._api, event[self.EVENT_COMMAND_KEY])
-            return self._handler.handle_command_update(command)
-        if action == self.EVENT_NOTIFICATION_ACTION:
-            notification = Notification(event[self.EVENT_NOTIFICATION_KEY])
-            return self._handler.handle_notification(notification)
+        handle_call = self._handle_event_calls.get(
+            event.get(self.EVENT_ACTION_KEY))
+        if handle_call:
+            return handle_call(event)
 
     def handle_disconnect(self):
-        pass
+        self._api.token.cancel_refresh()
+        if self._dispatcher is not None and not self._api.connected:
+            self._dispatcher.close()
@@ -0,0 +1,114 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.timestamps import utc_timestamp
+import threading
+import sqlite3
+import json
+
+
+class ApiOutbox(object):
+    """Api outbox class."""
+
+    NOTIFICATION_ACTION = 'notification/insert'
+    COMMAND_UPDATE_ACTION = 'command/update'
+
+    def __init__(self, path, max_size=100000, batch_size=100, window=1):
+        assert max_size > 0, 'Outbox max size must be positive'
+        assert batch_size > 0, 'Outbox batch size must be positive'
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._window = window
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False,
+                                           isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS outbox ('
+                                 'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                                 'action TEXT NOT NULL, '
+                                 'request TEXT NOT NULL)')
+        cursor = self._connection.execute('SELECT COUNT(*) FROM outbox')
+        self._size = cursor.fetchone()[0]
+        self._num_dropped = 0
+        self._num_poisoned = 0
+
+    @staticmethod
+    def timestamp():
+        return utc_timestamp()
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def num_dropped(self):
+        return self._num_dropped
+
+    @property
+    def num_poisoned(self):
+        return self._num_poisoned
+
+    def put(self, action, request):
+        request = json.dumps(request)
+        with self._lock:
+            self._connection.execute('INSERT INTO outbox (action, request) '
+                                     'VALUES (?, ?)', (action, request))
+            self._size += 1
+            if self._size <= self._max_size:
+                return
+            num_dropped = self._size - self._max_size
+            self._connection.execute('DELETE FROM outbox WHERE id IN ('
+                                     'SELECT id FROM outbox ORDER BY id '
+                                     'LIMIT ?)', (num_dropped,))
+            self._size = self._max_size
+            self._num_dropped += num_dropped
+
+    def batch(self):
+        with self._lock:
+            cursor = self._connection.execute('SELECT id, action, request '
+                                              'FROM outbox ORDER BY id '
+                                              'LIMIT ?', (self._batch_size,))
+            rows = cursor.fetchall()
+        return [(row_id, action, json.loads(request))
+                for row_id, action, request in rows]
+
+    def remove(self, row_ids):
+        if not row_ids:
+            return
+        with self._lock:
+            self._connection.execute('BEGIN')
+            self._connection.executemany('DELETE FROM outbox WHERE id = ?',
+                                         [(row_id,) for row_id in row_ids])
+            self._connection.execute('COMMIT')
+            cursor = self._connection.execute('SELECT COUNT(*) FROM outbox')
+            self._size = cursor.fetchone()[0]
+
+    def drop(self, row_ids):
+        self.remove(row_ids)
+        with self._lock:
+            self._num_poisoned += len(row_ids)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,80 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+
+
+class ApiPager(object):
+    """Api pager class."""
+
+    def __init__(self, call, page_size=100, prefetch=1, **kwargs):
+        assert page_size > 0, 'Page size must be positive'
+        assert prefetch >= 0, 'Prefetch must not be negative'
+        self._call = call
+        self._page_size = page_size
+        self._prefetch = prefetch
+        self._kwargs = kwargs
+
+    def __iter__(self):
+        if not self._prefetch:
+            return self._pages()
+        return self._prefetched_pages()
+
+    def _page(self, skip):
+        return self._call(take=self._page_size, skip=skip, **self._kwargs)
+
+    def _pages(self):
+        skip = 0
+        while True:
+            page = self._page(skip)
+            for item in page:
+                yield item
+            if len(page) < self._page_size:
+                return
+            skip += self._page_size
+
+    def _prefetched_pages(self):
+        executor = ThreadPoolExecutor(1)
+        pages = deque()
+        skip = 0
+        try:
+            for _ in range(self._prefetch + 1):
+                pages.append(executor.submit(self._page, skip))
+                skip += self._page_size
+            while pages:
+                page = pages.popleft().result()
+                if len(page) < self._page_size:
+                    while pages:
+                        pages.popleft().cancel()
+                for item in page:
+                    yield item
+                if not pages:
+                    return
+                pages.append(executor.submit(self._page, skip))
+                skip += self._page_size
+        finally:
+            for page in pages:
+                page.cancel()
+            executor.shutdown(False)
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def prefetch(self):
+        return self._prefetch
@@ -0,0 +1,71 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.api_request import ApiRequestError
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import six
+
+
+class ApiPipeline(object):
+    """Api pipeline class."""
+
+    def __init__(self, api, window=16):
+        assert window > 0, 'Pipeline window must be positive'
+        self._api = api
+        self._window = window
+        self._window_semaphore = threading.BoundedSemaphore(window)
+        self._executor = ThreadPoolExecutor(window)
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _release_window(self, future):
+        self._window_semaphore.release()
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def submit(self, call, *args, **kwargs):
+        if self._closed:
+            raise ApiPipelineError('Pipeline is closed.')
+        if isinstance(call, six.string_types):
+            call = getattr(self._api, call)
+        self._window_semaphore.acquire()
+        try:
+            future = self._executor.submit(call, *args, **kwargs)
+        except:
+            self._window_semaphore.release()
+            raise
+        future.add_done_callback(self._release_window)
+        return future
+
+    def close(self, wait=True):
+        self._closed = True
+        self._executor.shutdown(wait)
+
+
+class ApiPipelineError(ApiRequestError):
+    """Api pipeline error."""
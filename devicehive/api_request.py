@@ -100,13 +100,14 @@ class ApiRequest(object):
     def response_key(self, key):
         self._params['response_key'] = key
 
-    def execute(self, error_message):
+    def _extract(self):
         request_id = self._uuid()
         request = self._request.copy()
         logger.debug('Request id: %s. Action: %s. Request: %s. Params: %s.',
                      request_id, self._action, request, self._params)
-        response = self._api.transport.request(request_id, self._action,
-                                               request, **self._params)
+        return request_id, request
+
+    def _response(self, response, error_message):
         api_response = ApiResponse(response, self._params['response_key'])
         logger.debug('Response id: %s. Action: %s. Success: %s. Response: %s.',
                      api_response.id, api_response.action, api_response.success,
@@ -116,18 +117,43 @@ class ApiRequest(object):
         raise ApiResponseError(error_message, self._api.transport.name,
                                api_response.code, api_response.error)
 
+    def _single_flight_key(self):
+        if self._params['method'] != 'GET' or not self._params['url']:
+            return
+        if self._params['subscription_request'] or \
+                self._params['remove_subscription_request']:
+            return
+        return repr((self._action, self._params['url'],
+                     sorted(self._params['params'].items()),
+                     sorted(self._params['headers'].items()),
+                     sorted(self._request.items())))
+
+    def _execute(self, error_message):
+        request_id, request = self._extract()
+        response = self._api.transport.request(request_id, self._action,
+                                               request, **self._params)
+        return self._response(response, error_message)
+
+    def execute(self, error_message):
+        single_flight_key = self._single_flight_key()
+        if not single_flight_key:
+            return self._execute(error_message)
+        return self._api.single_flight.call(single_flight_key, self._execute,
+                                            error_message)
+
 
 class AuthApiRequest(ApiRequest):
     """Auth api request class."""
 
     def execute(self, error_message):
+        access_token = self._api.token.access_token
         self.header(*self._api.token.auth_header)
         try:
             return super(AuthApiRequest, self).execute(error_message)
         except ApiResponseError as api_response_error:
             if api_response_error.code != 401:
                 raise
-        self._api.token.auth()
+        self._api.token.auth(access_token)
         self.header(*self._api.token.auth_header)
         return super(AuthApiRequest, self).execute(error_message)
 
@@ -207,7 +233,9 @@ class AuthSubscriptionApiRequest(SubscriptionApiRequest):
         if response_code != 401:
             return
         try:
-            token.auth()
+            auth_header_value = params['headers'].get(token.AUTH_HEADER_NAME,
+                                                      '')
+            token.auth(auth_header_value[len(token.AUTH_HEADER_VALUE_PREFIX):])
             auth_header_name, auth_header_value = token.auth_header
             params['headers'][auth_header_name] = auth_header_value
             return True
@@ -0,0 +1,61 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from concurrent.futures import Future
+import threading
+import copy
+
+
+class ApiSingleFlight(object):
+    """Api single flight class."""
+
+    def __init__(self):
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._num_calls = 0
+        self._num_shared_calls = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {'calls': self._num_calls,
+                    'shared_calls': self._num_shared_calls,
+                    'in_flight': len(self._futures)}
+
+    def call(self, key, call, *args):
+        with self._lock:
+            self._num_calls += 1
+            future = self._futures.get(key)
+            shared_call = future is not None
+            if shared_call:
+                self._num_shared_calls += 1
+            else:
+                future = self._futures[key] = Future()
+        if shared_call:
+            return copy.deepcopy(future.result())
+        try:
+            result = call(*args)
+            future.set_result(copy.deepcopy(result))
+            return result
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        finally:
+            self._remove_future(key)
+
+    def _remove_future(self, key):
+        with self._lock:
+            del self._futures[key]
@@ -0,0 +1,439 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.async_token import AsyncToken
+from devicehive.api_request import AuthSubscriptionApiRequest
+from devicehive.async_api_request import AsyncApiRequest
+from devicehive.async_api_request import AsyncAuthApiRequest
+from devicehive.async_device import AsyncDevice
+from devicehive.async_command import AsyncCommand
+from devicehive.notification import Notification
+from devicehive.async_subscription import AsyncCommandsSubscription
+from devicehive.async_subscription import AsyncNotificationsSubscription
+from devicehive.async_network import AsyncNetwork
+from devicehive.async_device_type import AsyncDeviceType
+
+
+class AsyncApi(object):
+    """Async api class."""
+
+    def __init__(self, transport, auth):
+        self._transport = transport
+        self._token = AsyncToken(self, auth)
+        self._connected = True
+        self._subscriptions = set()
+        self.server_timestamp = None
+
+    async def _subscribe_insert_commands(self, device_id=None, network_ids=(),
+                                         device_type_ids=(), names=(),
+                                         timestamp=None):
+        action = 'command/insert'
+        join_names = ','.join(map(str, names))
+        join_network_ids = ','.join(map(str, network_ids))
+        join_device_type_ids = ','.join(map(str, device_type_ids))
+        if not timestamp:
+            timestamp = self.server_timestamp
+        auth_subscription_api_request = AuthSubscriptionApiRequest(self)
+        auth_subscription_api_request.action(action)
+        auth_subscription_api_request.url('device/command/poll')
+        auth_subscription_api_request.param('deviceId', device_id)
+        auth_subscription_api_request.param('networkIds', join_network_ids)
+        auth_subscription_api_request.param('deviceTypeIds',
+                                            join_device_type_ids)
+        auth_subscription_api_request.param('names', join_names)
+        auth_subscription_api_request.param('timestamp', timestamp)
+        auth_subscription_api_request.response_key('command')
+        api_request = AsyncApiRequest(self)
+        api_request.action('command/subscribe')
+        api_request.set('deviceId', device_id)
+        api_request.set('networkIds', network_ids)
+        api_request.set('deviceTypeIds', device_type_ids)
+        api_request.set('names', names)
+        api_request.set('timestamp', timestamp)
+        api_request.subscription_request(auth_subscription_api_request)
+        return await api_request.execute('Subscribe insert commands failure.')
+
+    async def _subscribe_update_commands(self, device_id=None, network_ids=(),
+                                         device_type_ids=(), names=(),
+                                         timestamp=None):
+        action = 'command/update'
+        join_names = ','.join(map(str, names))
+        join_network_ids = ','.join(map(str, network_ids))
+        join_device_type_ids = ','.join(map(str, device_type_ids))
+        if not timestamp:
+            timestamp = self.server_timestamp
+        auth_subscription_api_request = AuthSubscriptionApiRequest(self)
+        auth_subscription_api_request.action(action)
+        auth_subscription_api_request.url('device/command/poll')
+        auth_subscription_api_request.param('returnUpdatedCommands', True)
+        auth_subscription_api_request.param('deviceId', device_id)
+        auth_subscription_api_request.param('networkIds', join_network_ids)
+        auth_subscription_api_request.param('deviceTypeIds',
+                                            join_device_type_ids)
+        auth_subscription_api_request.param('names', join_names)
+        auth_subscription_api_request.param('timestamp', timestamp)
+        auth_subscription_api_request.response_timestamp_key('lastUpdated')
+        auth_subscription_api_request.response_key('command')
+        api_request = AsyncApiRequest(self)
+        api_request.action('command/subscribe')
+        api_request.set('returnUpdatedCommands', True)
+        api_request.set('deviceId', device_id)
+        api_request.set('networkIds', network_ids)
+        api_request.set('deviceTypeIds', device_type_ids)
+        api_request.set('names', names)
+        api_request.set('timestamp', timestamp)
+        api_request.subscription_request(auth_subscription_api_request)
+        return await api_request.execute('Subscribe update commands failure.')
+
+    async def _subscribe_notifications(self, device_id=None, network_ids=(),
+                                       device_type_ids=(), names=(),
+                                       timestamp=None):
+        action = 'notification/insert'
+        join_names = ','.join(map(str, names))
+        join_network_ids = ','.join(map(str, network_ids))
+        join_device_type_ids = ','.join(map(str, device_type_ids))
+        if not timestamp:
+            timestamp = self.server_timestamp
+        auth_subscription_api_request = AuthSubscriptionApiRequest(self)
+        auth_subscription_api_request.action(action)
+        auth_subscription_api_request.url('device/notification/poll')
+        auth_subscription_api_request.param('deviceId', device_id)
+        auth_subscription_api_request.param('networkIds', join_network_ids)
+        auth_subscription_api_request.param('deviceTypeIds',
+                                            join_device_type_ids)
+        auth_subscription_api_request.param('names', join_names)
+        auth_subscription_api_request.param('timestamp', timestamp)
+        auth_subscription_api_request.response_key('notification')
+        api_request = AsyncApiRequest(self)
+        api_request.action('notification/subscribe')
+        api_request.set('deviceId', device_id)
+        api_request.set('networkIds', network_ids)
+        api_request.set('deviceTypeIds', device_type_ids)
+        api_request.set('names', names)
+        api_request.set('timestamp', timestamp)
+        api_request.subscription_request(auth_subscription_api_request)
+        return await api_request.execute('Subscribe notifications failure.')
+
+    def _add_subscription(self, subscription):
+        if subscription in self._subscriptions:
+            return
+        self._subscriptions.add(subscription)
+
+    def remove_subscription(self, subscription):
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.remove(subscription)
+
+    async def apply_subscription_calls(self):
+        for subscription in self._subscriptions:
+            await subscription.subscribe()
+
+    @property
+    def transport(self):
+        return self._transport
+
+    @property
+    def token(self):
+        return self._token
+
+    @property
+    def connected(self):
+        return self._connected
+
+    async def get_info(self):
+        api_request = AsyncApiRequest(self)
+        api_request.url('info')
+        api_request.action('server/info')
+        api_request.response_key('info')
+        info = await api_request.execute('Info get failure.')
+        return {'api_version': info['apiVersion'],
+                'server_timestamp': info['serverTimestamp'],
+                'rest_server_url': info.get('restServerUrl'),
+                'websocket_server_url': info.get('webSocketServerUrl')}
+
+    async def get_cluster_info(self):
+        api_request = AsyncApiRequest(self)
+        api_request.url('info/config/cluster')
+        api_request.action('cluster/info')
+        api_request.response_key('clusterInfo')
+        return await api_request.execute('Cluster info get failure.')
+
+    async def get_property(self, name):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.url('configuration/{name}', name=name)
+        auth_api_request.action('configuration/get')
+        auth_api_request.response_key('configuration')
+        configuration = await auth_api_request.execute('Get property failure.')
+        return {'entity_version': configuration['entityVersion'],
+                'name': configuration['name'],
+                'value': configuration['value']}
+
+    async def set_property(self, name, value):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.method('PUT')
+        auth_api_request.url('configuration/{name}', name=name)
+        auth_api_request.action('configuration/put')
+        auth_api_request.set('value', value)
+        auth_api_request.response_key('configuration')
+        configuration = await auth_api_request.execute('Set property failure.')
+        return {'entity_version': configuration['entityVersion']}
+
+    async def delete_property(self, name):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.method('DELETE')
+        auth_api_request.url('configuration/{name}', name=name)
+        auth_api_request.action('configuration/delete')
+        await auth_api_request.execute('Delete property failure.')
+
+    async def refresh_token(self):
+        await self._token.refresh()
+        return self._token.access_token
+
+    async def subscribe_insert_commands(self, device_id=None, network_ids=(),
+                                        device_type_ids=(), names=(),
+                                        timestamp=None):
+        call = self._subscribe_insert_commands
+        args = (device_id, network_ids, device_type_ids, names, timestamp)
+        commands_subscription = AsyncCommandsSubscription(self, call, args)
+        await commands_subscription.subscribe()
+        self._add_subscription(commands_subscription)
+        return commands_subscription
+
+    async def subscribe_update_commands(self, device_id=None, network_ids=(),
+                                        device_type_ids=(), names=(),
+                                        timestamp=None):
+        call = self._subscribe_update_commands
+        args = (device_id, network_ids, device_type_ids, names, timestamp)
+        commands_subscription = AsyncCommandsSubscription(self, call, args)
+        await commands_subscription.subscribe()
+        self._add_subscription(commands_subscription)
+        return commands_subscription
+
+    async def subscribe_notifications(self, device_id=None, network_ids=(),
+                                      device_type_ids=(), names=(),
+                                      timestamp=None):
+        call = self._subscribe_notifications
+        args = (device_id, network_ids, device_type_ids, names, timestamp)
+        notifications_subscription = AsyncNotificationsSubscription(self, call,
+                                                                    args)
+        await notifications_subscription.subscribe()
+        self._add_subscription(notifications_subscription)
+        return notifications_subscription
+
+    async def list_devices(self, name=None, name_pattern=None, network_id=None,
+                           network_name=None, sort_field=None, sort_order=None,
+                           take=None, skip=None):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.url('device')
+        auth_api_request.action('device/list')
+        auth_api_request.param('name', name)
+        auth_api_request.param('namePattern', name_pattern)
+        auth_api_request.param('networkId', network_id)
+        auth_api_request.param('networkName', network_name)
+        auth_api_request.param('sortField', sort_field)
+        auth_api_request.param('sortOrder', sort_order)
+        auth_api_request.param('take', take)
+        auth_api_request.param('skip', skip)
+        auth_api_request.response_key('devices')
+        devices = await auth_api_request.execute('List devices failure.')
+        return [AsyncDevice(self, device) for device in devices]
+
+    async def get_device(self, device_id):
+        device = AsyncDevice(self)
+        await device.get(device_id)
+        return device
+
+    async def put_device(self, device_id, name=None, data=None,
+                         network_id=None, device_type_id=None,
+                         is_blocked=False):
+        if not name:
+            name = device_id
+        device = {AsyncDevice.ID_KEY: device_id,
+                  AsyncDevice.NAME_KEY: name,
+                  AsyncDevice.DATA_KEY: data,
+                  AsyncDevice.NETWORK_ID_KEY: network_id,
+                  AsyncDevice.DEVICE_TYPE_ID_KEY: device_type_id,
+                  AsyncDevice.IS_BLOCKED_KEY: is_blocked}
+        device = AsyncDevice(self, device)
+        await device.save()
+        await device.get(device_id)
+        return device
+
+    async def list_commands(self, device_id, start=None, end=None,
+                            command=None, status=None, sort_field=None,
+                            sort_order=None, take=None, skip=None):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.url('device/{deviceId}/command', deviceId=device_id)
+        auth_api_request.action('command/list')
+        auth_api_request.param('start', start)
+        auth_api_request.param('end', end)
+        auth_api_request.param('command', command)
+        auth_api_request.param('status', status)
+        auth_api_request.param('sortField', sort_field)
+        auth_api_request.param('sortOrder', sort_order)
+        auth_api_request.param('take', take)
+        auth_api_request.param('skip', skip)
+        auth_api_request.response_key('commands')
+        commands = await auth_api_request.execute('List commands failure.')
+        return [AsyncCommand(self, command) for command in commands]
+
+    async def send_command(self, device_id, command_name, parameters=None,
+                           lifetime=None, timestamp=None, status=None,
+                           result=None):
+        command = {AsyncCommand.COMMAND_KEY: command_name}
+        if parameters:
+            command[AsyncCommand.PARAMETERS_KEY] = parameters
+        if lifetime:
+            command[AsyncCommand.LIFETIME_KEY] = lifetime
+        if timestamp:
+            command[AsyncCommand.TIMESTAMP_KEY] = timestamp
+        if status:
+            command[AsyncCommand.STATUS_KEY] = status
+        if result:
+            command[AsyncCommand.RESULT_KEY] = result
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.method('POST')
+        auth_api_request.url('device/{deviceId}/command', deviceId=device_id)
+        auth_api_request.action('command/insert')
+        auth_api_request.set('command', command, True)
+        auth_api_request.response_key('command')
+        command = await auth_api_request.execute('Command send failure.')
+        command[AsyncCommand.DEVICE_ID_KEY] = device_id
+        command[AsyncCommand.COMMAND_KEY] = command_name
+        command[AsyncCommand.PARAMETERS_KEY] = parameters
+        command[AsyncCommand.LIFETIME_KEY] = lifetime
+        command[AsyncCommand.STATUS_KEY] = status
+        command[AsyncCommand.RESULT_KEY] = result
+        return AsyncCommand(self, command)
+
+    async def list_notifications(self, device_id, start=None, end=None,
+                                 notification=None, sort_field=None,
+                                 sort_order=None, take=None, skip=None):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.url('device/{deviceId}/notification',
+                             deviceId=device_id)
+        auth_api_request.action('notification/list')
+        auth_api_request.param('start', start)
+        auth_api_request.param('end', end)
+        auth_api_request.param('notification', notification)
+        auth_api_request.param('sortField', sort_field)
+        auth_api_request.param('sortOrder', sort_order)
+        auth_api_request.param('take', take)
+        auth_api_request.param('skip', skip)
+        auth_api_request.response_key('notifications')
+        notifications = await auth_api_request.execute(
+            'List notifications failure.')
+        return [Notification(notification) for notification in notifications]
+
+    async def send_notification(self, device_id, notification_name,
+                                parameters=None, timestamp=None):
+        notification = {'notification': notification_name}
+        if parameters:
+            notification['parameters'] = parameters
+        if timestamp:
+            notification['timestamp'] = timestamp
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.method('POST')
+        auth_api_request.url('device/{deviceId}/notification',
+                             deviceId=device_id)
+        auth_api_request.action('notification/insert')
+        auth_api_request.set('notification', notification, True)
+        auth_api_request.response_key('notification')
+        notification = await auth_api_request.execute(
+            'Notification send failure.')
+        notification[Notification.DEVICE_ID_KEY] = device_id
+        notification[Notification.NOTIFICATION_KEY] = notification_name
+        notification[Notification.PARAMETERS_KEY] = parameters
+        return Notification(notification)
+
+    async def list_networks(self, name=None, name_pattern=None,
+                            sort_field=None, sort_order=None, take=None,
+                            skip=None):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.url('network')
+        auth_api_request.action('network/list')
+        auth_api_request.param('name', name)
+        auth_api_request.param('namePattern', name_pattern)
+        auth_api_request.param('sortField', sort_field)
+        auth_api_request.param('sortOrder', sort_order)
+        auth_api_request.param('take', take)
+        auth_api_request.param('skip', skip)
+        auth_api_request.response_key('networks')
+        networks = await auth_api_request.execute('List networks failure.')
+        return [AsyncNetwork(self, network) for network in networks]
+
+    async def get_network(self, network_id):
+        network = AsyncNetwork(self)
+        await network.get(network_id)
+        return network
+
+    async def create_network(self, name, description):
+        network = {AsyncNetwork.NAME_KEY: name,
+                   AsyncNetwork.DESCRIPTION_KEY: description}
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.method('POST')
+        auth_api_request.url('network')
+        auth_api_request.action('network/insert')
+        auth_api_request.set('network', network, True)
+        auth_api_request.response_key('network')
+        network = await auth_api_request.execute('Network create failure.')
+        network[AsyncNetwork.NAME_KEY] = name
+        network[AsyncNetwork.DESCRIPTION_KEY] = description
+        return AsyncNetwork(self, network)
+
+    async def list_device_types(self, name=None, name_pattern=None,
+                                sort_field=None, sort_order=None, take=None,
+                                skip=None):
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.url('devicetype')
+        auth_api_request.action('devicetype/list')
+        auth_api_request.param('name', name)
+        auth_api_request.param('namePattern', name_pattern)
+        auth_api_request.param('sortField', sort_field)
+        auth_api_request.param('sortOrder', sort_order)
+        auth_api_request.param('take', take)
+        auth_api_request.param('skip', skip)
+        auth_api_request.response_key('deviceTypes')
+        device_types = await auth_api_request.execute(
+            'List device types failure.')
+        return [AsyncDeviceType(self, device_type)
+                for device_type in device_types]
+
+    async def get_device_type(self, device_type_id):
+        device_type = AsyncDeviceType(self)
+        await device_type.get(device_type_id)
+        return device_type
+
+    async def create_device_type(self, name, description):
+        device_type = {AsyncDeviceType.NAME_KEY: name,
+                       AsyncDeviceType.DESCRIPTION_KEY: description}
+        auth_api_request = AsyncAuthApiRequest(self)
+        auth_api_request.method('POST')
+        auth_api_request.url('devicetype')
+        auth_api_request.action('devicetype/insert')
+        auth_api_request.set('deviceType', device_type, True)
+        auth_api_request.response_key('deviceType')
+        device_type = await auth_api_request.execute(
+            'Device type create failure.')
+        device_type[AsyncDeviceType.NAME_KEY] = name
+        device_type[AsyncDeviceType.DESCRIPTION_KEY] = description
+        return AsyncDeviceType(self, device_type)
+
+    def disconnect(self):
+        self._connected = False
+        if not self._transport.connected:
+            return
+        self._transport.disconnect()
@@ -0,0 +1,85 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.handlers.handler import Handler
+from devicehive.async_api import AsyncApi
+from devicehive.async_command import AsyncCommand
+from devicehive.notification import Notification
+
+
+class AsyncApiHandler(Handler):
+    """Async api handler class."""
+
+    EVENT_ACTION_KEY = 'action'
+    EVENT_COMMAND_INSERT_ACTION = 'command/insert'
+    EVENT_COMMAND_UPDATE_ACTION = 'command/update'
+    EVENT_COMMAND_KEY = 'command'
+    EVENT_NOTIFICATION_ACTION = 'notification/insert'
+    EVENT_NOTIFICATION_KEY = 'notification'
+
+    def __init__(self, transport, auth, handler_class, handler_args,
+                 handler_kwargs, api_init):
+        super(AsyncApiHandler, self).__init__(transport)
+        self._api = AsyncApi(self._transport, auth)
+        self._handler = handler_class(self._api, *handler_args,
+                                      **handler_kwargs)
+        self._api_init = api_init
+        self._handle_connect = False
+
+    @property
+    def handler(self):
+        return self._handler
+
+    async def handle_connect(self):
+        await self._api.token.auth()
+        if self._api_init:
+            info = await self._api.get_info()
+            self._api.server_timestamp = info['server_timestamp']
+        await self._api.apply_subscription_calls()
+        if not self._handle_connect:
+            self._handle_connect = True
+            await self._handler.handle_connect()
+
+    async def _route(self, action, name, handle_call, event):
+        route = self._handler.router.route(action, name)
+        if route is None:
+            return await handle_call(event)
+        call, semaphore = route
+        if semaphore is None:
+            return await call(event)
+        async with semaphore:
+            return await call(event)
+
+    async def handle_event(self, event):
+        action = event.get(self.EVENT_ACTION_KEY)
+        if action == self.EVENT_COMMAND_INSERT_ACTION:
+            command = AsyncCommand(self._api, event[self.EVENT_COMMAND_KEY])
+            return await self._route(action, command.command,
+                                     self._handler.handle_command_insert,
+                                     command)
+        if action == self.EVENT_COMMAND_UPDATE_ACTION:
+            command = AsyncCommand(self._api, event[self.EVENT_COMMAND_KEY])
+            return await self._route(action, command.command,
+                                     self._handler.handle_command_update,
+                                     command)
+        if action == self.EVENT_NOTIFICATION_ACTION:
+            notification = Notification(event[self.EVENT_NOTIFICATION_KEY])
+            return await self._route(action, notification.notification,
+                                     self._handler.handle_notification,
+                                     notification)
+
+    async def handle_disconnect(self):
+        pass
@@ -0,0 +1,44 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.api_request import ApiRequest
+from devicehive.api_response import ApiResponseError
+
+
+class AsyncApiRequest(ApiRequest):
+    """Async api request class."""
+
+    async def execute(self, error_message):
+        request_id, request = self._extract()
+        response = await self._api.transport.request(request_id, self._action,
+                                                     request, **self._params)
+        return self._response(response, error_message)
+
+
+class AsyncAuthApiRequest(AsyncApiRequest):
+    """Async auth api request class."""
+
+    async def execute(self, error_message):
+        self.header(*self._api.token.auth_header)
+        try:
+            return await super(AsyncAuthApiRequest, self).execute(
+                error_message)
+        except ApiResponseError as api_response_error:
+            if api_response_error.code != 401:
+                raise
+        await self._api.token.auth()
+        self.header(*self._api.token.auth_header)
+        return await super(AsyncAuthApiRequest, self).execute(error_message)
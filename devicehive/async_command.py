@@ -0,0 +1,34 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.command import Command
+from devicehive.async_api_request import AsyncAuthApiRequest
+
+
+class AsyncCommand(Command):
+    """Async command class."""
+
+    __slots__ = ()
+
+    async def save(self):
+        command = {self.STATUS_KEY: self.status, self.RESULT_KEY: self.result}
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('PUT')
+        auth_api_request.url('device/{deviceId}/command/{commandId}',
+                             deviceId=self._device_id, commandId=self._id)
+        auth_api_request.action('command/update')
+        auth_api_request.set('command', command, True)
+        await auth_api_request.execute('Command save failure.')
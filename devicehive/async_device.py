@@ -0,0 +1,58 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.device import Device
+from devicehive.async_api_request import AsyncAuthApiRequest
+
+
+class AsyncDevice(Device):
+    """Async device class."""
+
+    async def get(self, device_id):
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.url('device/{deviceId}', deviceId=device_id)
+        auth_api_request.action('device/get')
+        auth_api_request.response_key('device')
+        device = await auth_api_request.execute('Device get failure.')
+        self._init(device)
+
+    async def save(self):
+        self._ensure_exists()
+        device = {self.NAME_KEY: self.name,
+                  self.DATA_KEY: self.data,
+                  self.NETWORK_ID_KEY: self.network_id,
+                  self.DEVICE_TYPE_ID_KEY: self.device_type_id,
+                  self.IS_BLOCKED_KEY: self.is_blocked}
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('PUT')
+        auth_api_request.url('device/{deviceId}', deviceId=self._id)
+        auth_api_request.action('device/save')
+        auth_api_request.set('device', device, True)
+        await auth_api_request.execute('Device save failure.')
+
+    async def remove(self):
+        self._ensure_exists()
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('DELETE')
+        auth_api_request.url('device/{deviceId}', deviceId=self._id)
+        auth_api_request.action('device/delete')
+        await auth_api_request.execute('Device remove failure.')
+        self._id = None
+        self.name = None
+        self.data = None
+        self.network_id = None
+        self.device_type_id = None
+        self.is_blocked = None
@@ -0,0 +1,117 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.data_formats.json_data_format import JsonDataFormat
+from devicehive.device_hive import DeviceHive
+from devicehive.async_api_handler import AsyncApiHandler
+import asyncio
+import logging
+import time
+import six
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDeviceHive(object):
+    """Async device hive class."""
+
+    UNSUPPORTED_OPTIONS = ('token_refresh_margin', 'cache_max_size',
+                           'cache_ttl', 'outbox_path', 'outbox_max_size',
+                           'outbox_batch_size', 'outbox_window',
+                           'dispatch_workers', 'dispatch_queue_max_size',
+                           'dispatch_queue_overflow_policy',
+                           'pool_connections', 'pool_maxsize', 'pool_block',
+                           'pool_idle_timeout', 'subscription_reactor',
+                           'subscription_coalescing')
+
+    def __init__(self, handler_class, *handler_args, **handler_kwargs):
+        self._api_handler_options = {'handler_class': handler_class,
+                                     'handler_args': handler_args,
+                                     'handler_kwargs': handler_kwargs}
+        self._data_format_class = JsonDataFormat
+        self._data_format_options = {}
+        self._transport = None
+
+    def _init_transport(self):
+        from devicehive.transports.async_websocket_transport import \
+            AsyncWebsocketTransport
+        self._transport = AsyncWebsocketTransport(self._data_format_class,
+                                                  self._data_format_options,
+                                                  AsyncApiHandler,
+                                                  self._api_handler_options)
+
+    def _ensure_transport_disconnect(self):
+        if self._transport.connected:
+            self._transport.disconnect()
+
+    @property
+    def transport(self):
+        return self._transport
+
+    @property
+    def handler(self):
+        return self._transport.handler.handler
+
+    async def connect(self, transport_url, **options):
+        transport_name = DeviceHive.transport_name(transport_url)
+        assert transport_name == 'websocket', 'Unexpected transport url scheme'
+        unsupported_options = [option for option in self.UNSUPPORTED_OPTIONS
+                               if option in options]
+        assert not unsupported_options, \
+            'Unsupported options: %s' % ', '.join(unsupported_options)
+        transport_keep_alive = options.pop('transport_keep_alive', True)
+        connect_timeout = options.pop('connect_timeout', 30)
+        max_num_connect = options.pop('max_num_connect', 10)
+        connect_interval = options.pop('connect_interval', 1)
+        auth = {'login': options.pop('login', None),
+                'password': options.pop('password', None),
+                'refresh_token': options.pop('refresh_token', None),
+                'access_token': options.pop('access_token', None)}
+        api_init = options.pop('api_init', True)
+        data_format = options.pop('data_format', 'json')
+        self._data_format_class = DeviceHive.data_format_class(data_format)
+        self._data_format_options = options.pop('data_format_options', {})
+        self._api_handler_options['auth'] = auth
+        self._api_handler_options['api_init'] = api_init
+        self._init_transport()
+        if not transport_keep_alive:
+            self._ensure_transport_disconnect()
+            self._transport.connect(transport_url, **options)
+            return
+        connect_time = time.time()
+        num_connect = 0
+        while True:
+            self._ensure_transport_disconnect()
+            self._transport.connect(transport_url, **options)
+            await self._transport.join()
+            exception_info = self._transport.exception_info
+            if exception_info:
+                if isinstance(exception_info[1], self._transport.error):
+                    logger.error('An error has occurred:',
+                                 exc_info=exception_info)
+                else:
+                    six.reraise(*exception_info)
+            if not self.handler.api.connected:
+                return
+            if time.time() - connect_time < connect_timeout:
+                num_connect += 1
+                if num_connect > max_num_connect:
+                    six.reraise(*exception_info)
+                await asyncio.sleep(connect_interval)
+                continue
+            connect_time = time.time()
+            num_connect = 0
@@ -0,0 +1,55 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.device_type import DeviceType
+from devicehive.async_api_request import AsyncAuthApiRequest
+
+
+class AsyncDeviceType(DeviceType):
+    """Async device type class."""
+
+    async def get(self, device_type_id):
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.url('devicetype/{deviceTypeId}',
+                             deviceTypeId=device_type_id)
+        auth_api_request.action('devicetype/get')
+        auth_api_request.response_key('deviceType')
+        device_type = await auth_api_request.execute('DeviceType get failure.')
+        self._init(device_type)
+
+    async def save(self):
+        self._ensure_exists()
+        device_type = {self.ID_KEY: self._id,
+                       self.NAME_KEY: self.name,
+                       self.DESCRIPTION_KEY: self.description}
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('PUT')
+        auth_api_request.url('devicetype/{deviceTypeId}', deviceTypeId=self._id)
+        auth_api_request.action('devicetype/update')
+        auth_api_request.set('deviceType', device_type, True)
+        await auth_api_request.execute('DeviceType save failure.')
+
+    async def remove(self, force=False):
+        self._ensure_exists()
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('DELETE')
+        auth_api_request.url('devicetype/{deviceTypeId}', deviceTypeId=self._id)
+        auth_api_request.action('devicetype/delete')
+        auth_api_request.param('force', force)
+        await auth_api_request.execute('DeviceType remove failure.')
+        self._id = None
+        self.name = None
+        self.description = None
@@ -0,0 +1,54 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.network import Network
+from devicehive.async_api_request import AsyncAuthApiRequest
+
+
+class AsyncNetwork(Network):
+    """Async network class."""
+
+    async def get(self, network_id):
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.url('network/{networkId}', networkId=network_id)
+        auth_api_request.action('network/get')
+        auth_api_request.response_key('network')
+        network = await auth_api_request.execute('Network get failure.')
+        self._init(network)
+
+    async def save(self):
+        self._ensure_exists()
+        network = {self.ID_KEY: self._id,
+                   self.NAME_KEY: self.name,
+                   self.DESCRIPTION_KEY: self.description}
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('PUT')
+        auth_api_request.url('network/{networkId}', networkId=self._id)
+        auth_api_request.action('network/update')
+        auth_api_request.set('network', network, True)
+        await auth_api_request.execute('Network save failure.')
+
+    async def remove(self, force=False):
+        self._ensure_exists()
+        auth_api_request = AsyncAuthApiRequest(self._api)
+        auth_api_request.method('DELETE')
+        auth_api_request.url('network/{networkId}', networkId=self._id)
+        auth_api_request.action('network/delete')
+        auth_api_request.param('force', force)
+        await auth_api_request.execute('Network remove failure.')
+        self._id = None
+        self.name = None
+        self.description = None
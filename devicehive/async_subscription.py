@@ -0,0 +1,49 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.subscription import CommandsSubscription
+from devicehive.subscription import NotificationsSubscription
+from devicehive.api_request import RemoveSubscriptionApiRequest
+from devicehive.async_api_request import AsyncApiRequest
+
+
+class AsyncSubscriptionMixin(object):
+    """Async subscription mixin class."""
+
+    async def subscribe(self):
+        subscription = await self._call(*self._args)
+        self._id = subscription[self.ID_KEY]
+
+    async def remove(self):
+        self._ensure_exists()
+        remove_subscription_api_request = RemoveSubscriptionApiRequest()
+        remove_subscription_api_request.subscription_id(self._id)
+        api_request = AsyncApiRequest(self._api)
+        api_request.action('%s/unsubscribe' % self._get_subscription_type())
+        api_request.set('subscriptionId', self._id)
+        api_request.remove_subscription_request(remove_subscription_api_request)
+        await api_request.execute('Unsubscribe failure.')
+        self._api.remove_subscription(self)
+        self._id = None
+
+
+class AsyncCommandsSubscription(AsyncSubscriptionMixin, CommandsSubscription):
+    """Async commands subscription class."""
+
+
+class AsyncNotificationsSubscription(AsyncSubscriptionMixin,
+                                     NotificationsSubscription):
+    """Async notifications subscription class."""
@@ -0,0 +1,70 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.token import Token
+from devicehive.token import TokenError
+from devicehive.async_api_request import AsyncApiRequest
+
+
+class AsyncToken(Token):
+    """Async token class."""
+
+    async def _auth(self):
+        api_request = AsyncApiRequest(self._api)
+        if not api_request.websocket_transport:
+            return
+        api_request.action('authenticate')
+        api_request.set('token', self._access_token)
+        await api_request.execute('Authentication failure.')
+
+    async def _tokens(self):
+        api_request = AsyncApiRequest(self._api)
+        api_request.method('POST')
+        api_request.url('token')
+        api_request.action('token')
+        api_request.set('login', self._login)
+        api_request.set('password', self._password)
+        tokens = await api_request.execute('Login failure.')
+        self._refresh_token = tokens['refreshToken']
+        self._access_token = tokens['accessToken']
+
+    async def refresh(self):
+        if not self._refresh_token:
+            raise TokenError('Can\'t refresh token without "refresh_token"')
+        api_request = AsyncApiRequest(self._api)
+        api_request.method('POST')
+        api_request.url('token/refresh')
+        api_request.action('token/refresh')
+        api_request.set('refreshToken', self._refresh_token)
+        tokens = await api_request.execute('Token refresh failure.')
+        self._access_token = tokens['accessToken']
+
+    async def auth(self):
+        if self._refresh_token:
+            await self.refresh()
+            await self._auth()
+            return
+        if self._access_token:
+            await self._auth()
+            return
+        if self._login and self._password:
+            await self._tokens()
+            await self._auth()
+            return
+        if self._login:
+            raise TokenError('Password required.')
+        if self._password:
+            raise TokenError('Login required.')
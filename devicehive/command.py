@@ -15,6 +15,7 @@
 
 
 from devicehive.api_request import AuthApiRequest
+from devicehive.api_outbox import ApiOutbox
 
 
 class Command(object):
@@ -31,6 +32,10 @@ class Command(object):
     STATUS_KEY = 'status'
     RESULT_KEY = 'result'
 
+    __slots__ = ('_api', '_device_id', '_id', '_user_id', '_command',
+                 '_parameters', '_lifetime', '_timestamp', '_last_updated',
+                 'status', 'result')
+
     def __init__(self, api, command):
         self._api = api
         self._device_id = command[self.DEVICE_ID_KEY]
@@ -75,12 +80,21 @@ class Command(object):
     def last_updated(self):
         return self._last_updated
 
-    def save(self):
-        command = {self.STATUS_KEY: self.status, self.RESULT_KEY: self.result}
-        auth_api_request = AuthApiRequest(self._api)
+    @staticmethod
+    def update(api, device_id, command_id, command):
+        auth_api_request = AuthApiRequest(api)
         auth_api_request.method('PUT')
         auth_api_request.url('device/{deviceId}/command/{commandId}',
-                             deviceId=self._device_id, commandId=self._id)
+                             deviceId=device_id, commandId=command_id)
         auth_api_request.action('command/update')
         auth_api_request.set('command', command, True)
         auth_api_request.execute('Command save failure.')
+
+    def save(self):
+        command = {self.STATUS_KEY: self.status, self.RESULT_KEY: self.result}
+        request = {'device_id': self._device_id,
+                   'command_id': self._id,
+                   'command': command}
+        self._api.outbox_call(ApiOutbox.COMMAND_UPDATE_ACTION, request,
+                              self.update, self._api, self._device_id, self._id,
+                              command)
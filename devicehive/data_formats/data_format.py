@@ -40,6 +40,10 @@ class DataFormat(object):
     def binary_data_type(self):
         return self._data_type == self.BINARY_DATA_TYPE
 
+    @property
+    def decode_text_bytes(self):
+        return False
+
     def encode(self, data):
         raise NotImplementedError
 
@@ -15,17 +15,47 @@
 
 
 from devicehive.data_formats.data_format import DataFormat
-import json
+import importlib
+import sys
+import six
 
 
 class JsonDataFormat(DataFormat):
     """Json data format class."""
 
-    def __init__(self):
+    BACKENDS = ('orjson', 'ujson', 'rapidjson', 'json')
+
+    def __init__(self, backend=None):
         super(JsonDataFormat, self).__init__('json', self.TEXT_DATA_TYPE)
+        self._backend_name, self._backend = self._import_backend(backend)
+        self._decode_text_bytes = self._backend_name != 'json' or six.PY2 or \
+            sys.version_info >= (3, 6)
+
+    def _import_backend(self, backend):
+        if backend:
+            return backend, importlib.import_module(backend)
+        for backend in self.BACKENDS:
+            try:
+                return backend, importlib.import_module(backend)
+            except ImportError:
+                continue
+
+    @property
+    def backend(self):
+        return self._backend_name
+
+    @property
+    def decode_text_bytes(self):
+        return self._decode_text_bytes
 
     def encode(self, data):
-        return json.dumps(data)
+        data = self._backend.dumps(data)
+        if isinstance(data, six.binary_type):
+            return data.decode('utf-8')
+        return data
 
     def decode(self, data):
-        return json.loads(data)
+        if not self._decode_text_bytes and \
+                isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return self._backend.loads(data)
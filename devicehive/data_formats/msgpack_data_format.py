@@ -0,0 +1,34 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.data_formats.data_format import DataFormat
+import msgpack
+
+
+class MsgPackDataFormat(DataFormat):
+    """MessagePack data format class."""
+
+    def __init__(self, use_single_float=False):
+        super(MsgPackDataFormat, self).__init__('msgpack',
+                                                self.BINARY_DATA_TYPE)
+        self._use_single_float = use_single_float
+
+    def encode(self, data):
+        return msgpack.packb(data, use_bin_type=True,
+                             use_single_float=self._use_single_float)
+
+    def decode(self, data):
+        return msgpack.unpackb(data, raw=False)
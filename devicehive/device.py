@@ -27,6 +27,7 @@ class Device(object):
     NETWORK_ID_KEY = 'networkId'
     DEVICE_TYPE_ID_KEY = 'deviceTypeId'
     IS_BLOCKED_KEY = 'isBlocked'
+    CACHE_KEY = 'device'
 
     def __init__(self, api, device=None):
         self._api = api
@@ -56,12 +57,16 @@ class Device(object):
     def id(self):
         return self._id
 
-    def get(self, device_id):
+    def _get(self, device_id):
         auth_api_request = AuthApiRequest(self._api)
         auth_api_request.url('device/{deviceId}', deviceId=device_id)
         auth_api_request.action('device/get')
         auth_api_request.response_key('device')
-        device = auth_api_request.execute('Device get failure.')
+        return auth_api_request.execute('Device get failure.')
+
+    def get(self, device_id):
+        device = self._api.cache_call(self.CACHE_KEY, device_id, self._get,
+                                      device_id)
         self._init(device)
 
     def save(self):
@@ -77,6 +82,7 @@ class Device(object):
         auth_api_request.action('device/save')
         auth_api_request.set('device', device, True)
         auth_api_request.execute('Device save failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
 
     def remove(self):
         self._ensure_exists()
@@ -85,6 +91,7 @@ class Device(object):
         auth_api_request.url('device/{deviceId}', deviceId=self._id)
         auth_api_request.action('device/delete')
         auth_api_request.execute('Device remove failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
         self._id = None
         self.name = None
         self.data = None
@@ -97,6 +104,10 @@ class Device(object):
         return self._api.subscribe_insert_commands(self.id, names=names,
                                                    timestamp=timestamp)
 
+    def send_notifications(self, notifications, window=16):
+        self._ensure_exists()
+        return self._api.send_notifications(self._id, notifications, window)
+
     def subscribe_update_commands(self, names=(), timestamp=None):
         self._ensure_exists()
         return self._api.subscribe_update_commands(self.id, names=names,
@@ -111,14 +122,34 @@ class Device(object):
                                        sort_order=sort_order,
                                        take=take, skip=skip)
 
+    def iter_commands(self, start=None, end=None, command=None, status=None,
+                      sort_field=None, sort_order=None, page_size=100,
+                      prefetch=1):
+        self._ensure_exists()
+        return self._api.iter_commands(device_id=self._id, start=start, end=end,
+                                       command=command, status=status,
+                                       sort_field=sort_field,
+                                       sort_order=sort_order,
+                                       page_size=page_size, prefetch=prefetch)
+
     def send_command(self, command_name, parameters=None, lifetime=None,
-                     timestamp=None, status=None, result=None):
+                     timestamp=None, status=None, result=None, wait=False,
+                     timeout=None):
         self._ensure_exists()
         return self._api.send_command(device_id=self._id,
                                       command_name=command_name,
                                       parameters=parameters, lifetime=lifetime,
                                       timestamp=timestamp, status=status,
-                                      result=result)
+                                      result=result, wait=wait,
+                                      timeout=timeout)
+
+    def send_command_future(self, command_name, parameters=None,
+                            lifetime=None, timestamp=None, status=None,
+                            result=None):
+        self._ensure_exists()
+        return self._api.send_command_future(self._id, command_name,
+                                             parameters, lifetime, timestamp,
+                                             status, result)
 
     def subscribe_notifications(self, names=(), timestamp=None):
         self._ensure_exists()
@@ -136,6 +167,18 @@ class Device(object):
                                             sort_order=sort_order,
                                             take=take, skip=skip)
 
+    def iter_notifications(self, start=None, end=None, notification=None,
+                           sort_field=None, sort_order=None, page_size=100,
+                           prefetch=1):
+        self._ensure_exists()
+        return self._api.iter_notifications(device_id=self._id, start=start,
+                                            end=end,
+                                            notification=notification,
+                                            sort_field=sort_field,
+                                            sort_order=sort_order,
+                                            page_size=page_size,
+                                            prefetch=prefetch)
+
     def send_notification(self, notification_name, parameters=None,
                           timestamp=None):
         self._ensure_exists()
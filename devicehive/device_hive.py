@@ -23,6 +23,9 @@ import six
 
 logger = logging.getLogger(__name__)
 
+DATA_FORMAT_CLASS_NAMES = {'json': 'JsonDataFormat',
+                           'msgpack': 'MsgPackDataFormat'}
+
 
 class DeviceHive(object):
     """Device hive class."""
@@ -32,6 +35,8 @@ class DeviceHive(object):
                                      'handler_args': handler_args,
                                      'handler_kwargs': handler_kwargs}
         self._transport_name = None
+        self._data_format_class = JsonDataFormat
+        self._data_format_options = {}
         self._transport = None
 
     def _init_transport(self):
@@ -39,7 +44,9 @@ class DeviceHive(object):
         class_name = '%sTransport' % self._transport_name.title()
         transport_module = __import__(name, globals(), locals(), [name])
         transport_class = getattr(transport_module, class_name)
-        self._transport = transport_class(JsonDataFormat, {}, ApiHandler,
+        self._transport = transport_class(self._data_format_class,
+                                          self._data_format_options,
+                                          ApiHandler,
                                           self._api_handler_options)
 
     def _ensure_transport_disconnect(self):
@@ -53,6 +60,16 @@ class DeviceHive(object):
         if transport_url[0:2] == 'ws':
             return 'websocket'
 
+    @staticmethod
+    def data_format_class(data_format):
+        if not isinstance(data_format, six.string_types):
+            return data_format
+        class_name = DATA_FORMAT_CLASS_NAMES.get(data_format)
+        assert class_name, 'Unexpected data format name'
+        name = 'devicehive.data_formats.%s_data_format' % data_format
+        data_format_module = __import__(name, globals(), locals(), [name])
+        return getattr(data_format_module, class_name)
+
     @property
     def transport(self):
         return self._transport
@@ -73,10 +90,39 @@ class DeviceHive(object):
         auth = {'login': options.pop('login', None),
                 'password': options.pop('password', None),
                 'refresh_token': options.pop('refresh_token', None),
-                'access_token': options.pop('access_token', None)}
+                'access_token': options.pop('access_token', None),
+                'refresh_margin': options.pop('token_refresh_margin', 60)}
         api_init = options.pop('api_init', True)
+        cache_max_size = options.pop('cache_max_size', None)
+        cache_ttl = options.pop('cache_ttl', 60)
+        outbox_path = options.pop('outbox_path', None)
+        outbox_max_size = options.pop('outbox_max_size', 100000)
+        outbox_batch_size = options.pop('outbox_batch_size', 100)
+        outbox_window = options.pop('outbox_window', 1)
+        dispatch_workers = options.pop('dispatch_workers', 0)
+        dispatch_queue_max_size = options.pop('dispatch_queue_max_size', 0)
+        dispatch_queue_overflow_policy = options.pop(
+            'dispatch_queue_overflow_policy', 'block')
+        data_format = options.pop('data_format', 'json')
+        self._data_format_class = self.data_format_class(data_format)
+        self._data_format_options = options.pop('data_format_options', {})
         self._api_handler_options['auth'] = auth
         self._api_handler_options['api_init'] = api_init
+        self._api_handler_options['cache_options'] = None
+        if cache_max_size:
+            self._api_handler_options['cache_options'] = {
+                'max_size': cache_max_size, 'ttl': cache_ttl}
+        self._api_handler_options['outbox_options'] = None
+        if outbox_path:
+            self._api_handler_options['outbox_options'] = {
+                'path': outbox_path, 'max_size': outbox_max_size,
+                'batch_size': outbox_batch_size, 'window': outbox_window}
+        self._api_handler_options['dispatcher_options'] = None
+        if dispatch_workers:
+            self._api_handler_options['dispatcher_options'] = {
+                'num_workers': dispatch_workers,
+                'queue_max_size': dispatch_queue_max_size,
+                'queue_overflow_policy': dispatch_queue_overflow_policy}
         self._init_transport()
         if not transport_keep_alive:
             self._ensure_transport_disconnect()
@@ -16,6 +16,9 @@
 
 from devicehive.handler import Handler
 from devicehive.device_hive import DeviceHive
+from devicehive.api_pager import ApiPager
+from devicehive.api_backfill import ApiBackfill
+import threading
 import time
 import six
 
@@ -48,6 +51,21 @@ class ApiCallHandler(Handler):
             time.sleep(self._timeout)
 
 
+class ApiSessionHandler(Handler):
+    """Api session handler class."""
+
+    def __init__(self, api):
+        super(ApiSessionHandler, self).__init__(api)
+        self._ready = False
+
+    @property
+    def ready(self):
+        return self._ready
+
+    def handle_connect(self):
+        self._ready = True
+
+
 class DeviceHiveApi(object):
     """Device hive api class."""
 
@@ -56,6 +74,12 @@ class DeviceHiveApi(object):
         transport_alive_sleep_time = options.pop('transport_alive_sleep_time',
                                                  1e-6)
         self._transport_alive_sleep_time = transport_alive_sleep_time
+        self._persistent = options.pop('persistent', False)
+        self._device_hive = None
+        self._device_hive_lock = threading.Lock()
+        self._num_connects = 0
+        if not self._persistent:
+            options.setdefault('token_refresh_margin', None)
         options['transport_keep_alive'] = False
         options['api_init'] = False
         self._options = options
@@ -86,15 +110,58 @@ class DeviceHiveApi(object):
         unset_methods = ['list_devices']
         DeviceHiveApi._unset_methods(device_type, unset_methods)
 
-    def _call(self, call, *args, **kwargs):
-        device_hive = DeviceHive(ApiCallHandler, call, *args, **kwargs)
+    def _connect(self, handler_class, *handler_args, **handler_kwargs):
+        device_hive = DeviceHive(handler_class, *handler_args,
+                                 **handler_kwargs)
         device_hive.connect(self._transport_url, **self._options)
         while not device_hive.handler.ready:
             time.sleep(self._transport_alive_sleep_time)
             if device_hive.transport.exception_info:
                 six.reraise(*device_hive.transport.exception_info)
+        return device_hive
+
+    def _session_device_hive(self):
+        with self._device_hive_lock:
+            if self._device_hive and self._device_hive.transport.connected \
+                    and self._device_hive.transport.is_alive():
+                return self._device_hive
+            self._device_hive = self._connect(ApiSessionHandler)
+            self._num_connects += 1
+            return self._device_hive
+
+    def _call(self, call, *args, **kwargs):
+        if self._persistent:
+            api = self._session_device_hive().handler.api
+            return getattr(api, call)(*args, **kwargs)
+        device_hive = self._connect(ApiCallHandler, call, *args, **kwargs)
         return device_hive.handler.result
 
+    @property
+    def transport_url(self):
+        return self._transport_url
+
+    @property
+    def persistent(self):
+        return self._persistent
+
+    @property
+    def num_connects(self):
+        return self._num_connects
+
+    def close(self):
+        with self._device_hive_lock:
+            device_hive, self._device_hive = self._device_hive, None
+        if not device_hive or not device_hive.transport.connected:
+            return
+        device_hive.handler.api.disconnect()
+        device_hive.transport.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get_info(self):
         return self._call('get_info')
 
@@ -121,6 +188,9 @@ class DeviceHiveApi(object):
         [self._unset_device_methods(device) for device in devices]
         return devices
 
+    def iter_devices(self, page_size=100, prefetch=1, **kwargs):
+        return ApiPager(self.list_devices, page_size, prefetch, **kwargs)
+
     def get_device(self, *args, **kwargs):
         device = self._call('get_device', *args, **kwargs)
         self._unset_device_methods(device)
@@ -134,20 +204,51 @@ class DeviceHiveApi(object):
     def list_commands(self, *args, **kwargs):
         return self._call('list_commands', *args, **kwargs)
 
+    def iter_commands(self, device_id, page_size=100, prefetch=1, **kwargs):
+        return ApiPager(self.list_commands, page_size, prefetch,
+                        device_id=device_id, **kwargs)
+
+    def backfill_commands(self, device_ids, start, end, num_shards=16,
+                          concurrency=8, page_size=1000, **kwargs):
+        return ApiBackfill(self.list_commands, device_ids, start, end,
+                           num_shards, concurrency, page_size, **kwargs)
+
     def send_command(self, *args, **kwargs):
         return self._call('send_command', *args, **kwargs)
 
+    def send_command_future(self, *args, **kwargs):
+        return self._call('send_command_future', *args, **kwargs)
+
     def list_notifications(self, *args, **kwargs):
         return self._call('list_notifications', *args, **kwargs)
 
+    def iter_notifications(self, device_id, page_size=100, prefetch=1,
+                           **kwargs):
+        return ApiPager(self.list_notifications, page_size, prefetch,
+                        device_id=device_id, **kwargs)
+
+    def backfill_notifications(self, device_ids, start, end, num_shards=16,
+                               concurrency=8, page_size=1000, **kwargs):
+        return ApiBackfill(self.list_notifications, device_ids, start, end,
+                           num_shards, concurrency, page_size, **kwargs)
+
     def send_notification(self, *args, **kwargs):
         return self._call('send_notification', *args, **kwargs)
 
+    def send_notifications(self, *args, **kwargs):
+        return self._call('send_notifications', *args, **kwargs)
+
+    def send_bulk_notifications(self, *args, **kwargs):
+        return self._call('send_bulk_notifications', *args, **kwargs)
+
     def list_networks(self, *args, **kwargs):
         networks = self._call('list_networks', *args, **kwargs)
         [self._unset_network_methods(network) for network in networks]
         return networks
 
+    def iter_networks(self, page_size=100, prefetch=1, **kwargs):
+        return ApiPager(self.list_networks, page_size, prefetch, **kwargs)
+
     def get_network(self, *args, **kwargs):
         network = self._call('get_network', *args, **kwargs)
         self._unset_network_methods(network)
@@ -164,6 +265,9 @@ class DeviceHiveApi(object):
             self._unset_device_type_methods(device_type)
         return device_types
 
+    def iter_device_types(self, page_size=100, prefetch=1, **kwargs):
+        return ApiPager(self.list_device_types, page_size, prefetch, **kwargs)
+
     def get_device_type(self, *args, **kwargs):
         device_type = self._call('get_device_type', *args, **kwargs)
         self._unset_device_type_methods(device_type)
@@ -177,6 +281,9 @@ class DeviceHiveApi(object):
     def list_users(self, *args, **kwargs):
         return self._call('list_users', *args, **kwargs)
 
+    def iter_users(self, page_size=100, prefetch=1, **kwargs):
+        return ApiPager(self.list_users, page_size, prefetch, **kwargs)
+
     def get_current_user(self):
         return self._call('get_current_user')
 
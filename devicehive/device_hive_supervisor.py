@@ -0,0 +1,170 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.device_hive import DeviceHive
+from devicehive.hash_ring import HashRing
+import multiprocessing
+import threading
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+def _assignments(device_hive, assignments_queue):
+    while True:
+        device_ids, removed_device_ids = assignments_queue.get()
+        while not device_hive.transport or \
+                not device_hive.transport.connected:
+            time.sleep(0.1)
+        handler = device_hive.handler
+        handle_device_ids = getattr(handler, 'handle_device_ids', None)
+        if handle_device_ids:
+            handle_device_ids(device_ids, removed_device_ids)
+
+
+def _worker(handler_class, handler_args, handler_kwargs, device_ids,
+            assignments_queue, transport_url, options):
+    handler_kwargs = dict(handler_kwargs, device_ids=device_ids)
+    device_hive = DeviceHive(handler_class, *handler_args, **handler_kwargs)
+    assignments_thread = threading.Thread(target=_assignments,
+                                          args=(device_hive,
+                                                assignments_queue))
+    assignments_thread.name = 'device-hive-supervisor-assignments'
+    assignments_thread.daemon = True
+    assignments_thread.start()
+    device_hive.connect(transport_url, **options)
+
+
+class DeviceHiveSupervisor(object):
+    """Device hive supervisor class."""
+
+    def __init__(self, handler_class, *handler_args, **handler_kwargs):
+        self._handler_class = handler_class
+        self._handler_args = handler_args
+        self._handler_kwargs = handler_kwargs
+        self._ring = HashRing()
+        self._workers = {}
+        self._assignments = {}
+        self._device_ids = []
+        self._num_workers_started = 0
+        self._num_rebalances = 0
+        self._stopped = False
+
+    def _add_worker(self):
+        worker_id = self._num_workers_started
+        self._num_workers_started += 1
+        self._ring.add(worker_id)
+        return worker_id
+
+    def _start_worker(self, worker_id, device_ids, transport_url, options):
+        assignments_queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=_worker, args=(self._handler_class, self._handler_args,
+                                  self._handler_kwargs, device_ids,
+                                  assignments_queue, transport_url, options))
+        process.name = 'device-hive-worker-%s' % worker_id
+        process.daemon = True
+        process.start()
+        self._workers[worker_id] = (process, assignments_queue)
+        self._assignments[worker_id] = device_ids
+
+    def _remove_worker(self, worker_id):
+        del self._workers[worker_id]
+        del self._assignments[worker_id]
+        self._ring.remove(worker_id)
+
+    def _rebalance(self, assignments):
+        self._num_rebalances += 1
+        for worker_id, device_ids in assignments.items():
+            previous_device_ids = set(self._assignments[worker_id])
+            added_device_ids = [device_id for device_id in device_ids
+                                if device_id not in previous_device_ids]
+            previous_device_ids.difference_update(device_ids)
+            removed_device_ids = [device_id for device_id
+                                  in self._assignments[worker_id]
+                                  if device_id in previous_device_ids]
+            if not added_device_ids and not removed_device_ids:
+                continue
+            self._assignments[worker_id] = device_ids
+            process, assignments_queue = self._workers[worker_id]
+            if process.is_alive():
+                assignments_queue.put((added_device_ids, removed_device_ids))
+
+    def _dead_worker_ids(self):
+        dead_worker_ids = [worker_id for worker_id, (process, _)
+                           in self._workers.items() if not process.is_alive()]
+        for worker_id in dead_worker_ids:
+            process, _ = self._workers[worker_id]
+            logger.warning('Worker %s exited with code %s.', worker_id,
+                           process.exitcode)
+        return dead_worker_ids
+
+    @property
+    def workers(self):
+        return {worker_id: process.pid
+                for worker_id, (process, _) in self._workers.items()}
+
+    @property
+    def assignments(self):
+        return dict(self._assignments)
+
+    @property
+    def num_rebalances(self):
+        return self._num_rebalances
+
+    def run(self, transport_url, device_ids, num_workers=None, respawn=False,
+            check_interval=1, **options):
+        if not num_workers:
+            num_workers = multiprocessing.cpu_count()
+        self._device_ids = list(device_ids)
+        self._stopped = False
+        worker_ids = [self._add_worker() for _ in range(num_workers)]
+        assignments = self._ring.assign(self._device_ids)
+        for worker_id in worker_ids:
+            self._start_worker(worker_id, assignments[worker_id],
+                               transport_url, options)
+        try:
+            while True:
+                time.sleep(check_interval)
+                if self._stopped:
+                    return
+                dead_worker_ids = self._dead_worker_ids()
+                if not dead_worker_ids:
+                    continue
+                if respawn:
+                    for worker_id in dead_worker_ids:
+                        self._start_worker(worker_id,
+                                           self._assignments[worker_id],
+                                           transport_url, options)
+                    continue
+                for worker_id in dead_worker_ids:
+                    self._remove_worker(worker_id)
+                if not self._workers:
+                    return
+                self._rebalance(self._ring.assign(self._device_ids))
+        finally:
+            self.stop()
+
+    def stop(self):
+        self._stopped = True
+        processes = [process for process, _ in self._workers.values()]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
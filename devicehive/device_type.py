@@ -24,6 +24,7 @@ class DeviceType(object):
     ID_KEY = 'id'
     NAME_KEY = 'name'
     DESCRIPTION_KEY = 'description'
+    CACHE_KEY = 'device_type'
 
     def __init__(self, api, device_type=None):
         self._api = api
@@ -47,13 +48,17 @@ class DeviceType(object):
     def id(self):
         return self._id
 
-    def get(self, device_type_id):
+    def _get(self, device_type_id):
         auth_api_request = AuthApiRequest(self._api)
         auth_api_request.url('devicetype/{deviceTypeId}',
                              deviceTypeId=device_type_id)
         auth_api_request.action('devicetype/get')
         auth_api_request.response_key('deviceType')
-        devicetype = auth_api_request.execute('DeviceType get failure.')
+        return auth_api_request.execute('DeviceType get failure.')
+
+    def get(self, device_type_id):
+        devicetype = self._api.cache_call(self.CACHE_KEY, device_type_id,
+                                          self._get, device_type_id)
         self._init(devicetype)
 
     def save(self):
@@ -67,6 +72,7 @@ class DeviceType(object):
         auth_api_request.action('devicetype/update')
         auth_api_request.set('deviceType', device_type, True)
         auth_api_request.execute('DeviceType save failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
 
     def remove(self, force=False):
         self._ensure_exists()
@@ -76,6 +82,7 @@ class DeviceType(object):
         auth_api_request.action('devicetype/delete')
         auth_api_request.param('force', force)
         auth_api_request.execute('DeviceType remove failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
         self._id = None
         self.name = None
         self.description = None
@@ -14,19 +14,45 @@
 # =============================================================================
 
 
+from devicehive.handler_router import HandlerRouter
+import threading
 import warnings
 
 
 class Handler(object):
     """Handler class."""
 
+    ROUTE_SEMAPHORE_CLASS = threading.BoundedSemaphore
+
     def __init__(self, api):
         self._api = api
+        self._router = HandlerRouter(
+            semaphore_class=self.ROUTE_SEMAPHORE_CLASS)
+        self._router.add_routes(self)
+
+    @staticmethod
+    def on_command(name, max_concurrency=None):
+        return HandlerRouter.decorator(HandlerRouter.COMMAND_INSERT_ACTION,
+                                       name, max_concurrency)
+
+    @staticmethod
+    def on_command_update(name, max_concurrency=None):
+        return HandlerRouter.decorator(HandlerRouter.COMMAND_UPDATE_ACTION,
+                                       name, max_concurrency)
+
+    @staticmethod
+    def on_notification(name, max_concurrency=None):
+        return HandlerRouter.decorator(HandlerRouter.NOTIFICATION_ACTION,
+                                       name, max_concurrency)
 
     @property
     def api(self):
         return self._api
 
+    @property
+    def router(self):
+        return self._router
+
     def handle_connect(self):
         raise NotImplementedError
 
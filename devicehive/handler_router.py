@@ -0,0 +1,98 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import threading
+
+
+class HandlerRouter(object):
+    """Handler router class."""
+
+    COMMAND_INSERT_ACTION = 'command/insert'
+    COMMAND_UPDATE_ACTION = 'command/update'
+    NOTIFICATION_ACTION = 'notification/insert'
+    WILDCARD = '*'
+    ROUTES_ATTR = '_handler_routes'
+
+    def __init__(self, max_resolved=4096,
+                 semaphore_class=threading.BoundedSemaphore):
+        self._semaphore_class = semaphore_class
+        self._routes = {}
+        self._resolved = {}
+        self._max_resolved = max_resolved
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def decorator(action, name, max_concurrency=None):
+        # max_concurrency only limits something when events are handled
+        # concurrently, i.e. with the dispatch_workers connect option.
+        # Otherwise events are handled one at a time by the connection.
+        def decorate(call):
+            routes = getattr(call, HandlerRouter.ROUTES_ATTR, [])
+            routes.append((action, name, max_concurrency))
+            setattr(call, HandlerRouter.ROUTES_ATTR, routes)
+            return call
+
+        return decorate
+
+    def _resolve(self, action, name):
+        routes = self._routes.get(action, {})
+        route = routes.get(name)
+        if route:
+            return route
+        if name is None:
+            return routes.get(self.WILDCARD)
+        patterns = [pattern for pattern in routes
+                    if pattern.endswith(self.WILDCARD)]
+        for pattern in sorted(patterns, key=len, reverse=True):
+            if name.startswith(pattern[:-1]):
+                return routes[pattern]
+
+    def add(self, action, name, call, max_concurrency=None):
+        semaphore = None
+        if max_concurrency:
+            semaphore = self._semaphore_class(max_concurrency)
+        with self._lock:
+            self._routes.setdefault(action, {})[name] = (call, semaphore)
+            self._resolved = {}
+
+    def add_routes(self, handler):
+        handler_class = type(handler)
+        for attr_name in dir(handler_class):
+            routes = getattr(getattr(handler_class, attr_name),
+                             self.ROUTES_ATTR, ())
+            for action, name, max_concurrency in routes:
+                self.add(action, name, getattr(handler, attr_name),
+                         max_concurrency)
+
+    def route(self, action, name):
+        key = (action, name)
+        resolved = self._resolved
+        if key in resolved:
+            return resolved[key]
+        with self._lock:
+            route = self._resolve(action, name)
+            if len(self._resolved) >= self._max_resolved:
+                self._resolved = {}
+            self._resolved[key] = route
+        return route
+
+    @staticmethod
+    def call(route, event):
+        call, semaphore = route
+        if semaphore is None:
+            return call(event)
+        with semaphore:
+            return call(event)
@@ -0,0 +1,78 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import bisect
+import hashlib
+import six
+
+
+class HashRing(object):
+    """Hash ring class."""
+
+    def __init__(self, nodes=(), num_replicas=100):
+        self._num_replicas = num_replicas
+        self._nodes = set()
+        self._keys = []
+        self._ring = {}
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(key):
+        if not isinstance(key, six.binary_type):
+            key = six.text_type(key).encode('utf-8')
+        return int(hashlib.md5(key).hexdigest()[:16], 16)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    @property
+    def nodes(self):
+        return sorted(self._nodes)
+
+    def add(self, node):
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for replica in range(self._num_replicas):
+            key = self._hash('%s-%s' % (node, replica))
+            self._ring[key] = node
+            bisect.insort(self._keys, key)
+
+    def remove(self, node):
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        for replica in range(self._num_replicas):
+            key = self._hash('%s-%s' % (node, replica))
+            del self._ring[key]
+            self._keys.pop(bisect.bisect_left(self._keys, key))
+
+    def node(self, key):
+        if not self._keys:
+            raise HashRingError('Hash ring is empty.')
+        i = bisect.bisect(self._keys, self._hash(key)) % len(self._keys)
+        return self._ring[self._keys[i]]
+
+    def assign(self, keys):
+        assignments = {node: [] for node in self._nodes}
+        for key in keys:
+            assignments[self.node(key)].append(key)
+        return assignments
+
+
+class HashRingError(Exception):
+    """Hash ring error."""
@@ -24,6 +24,7 @@ class Network(object):
     ID_KEY = 'id'
     NAME_KEY = 'name'
     DESCRIPTION_KEY = 'description'
+    CACHE_KEY = 'network'
 
     def __init__(self, api, network=None):
         self._api = api
@@ -47,12 +48,16 @@ class Network(object):
     def id(self):
         return self._id
 
-    def get(self, network_id):
+    def _get(self, network_id):
         auth_api_request = AuthApiRequest(self._api)
         auth_api_request.url('network/{networkId}', networkId=network_id)
         auth_api_request.action('network/get')
         auth_api_request.response_key('network')
-        network = auth_api_request.execute('Network get failure.')
+        return auth_api_request.execute('Network get failure.')
+
+    def get(self, network_id):
+        network = self._api.cache_call(self.CACHE_KEY, network_id, self._get,
+                                       network_id)
         self._init(network)
 
     def save(self):
@@ -66,6 +71,7 @@ class Network(object):
         auth_api_request.action('network/update')
         auth_api_request.set('network', network, True)
         auth_api_request.execute('Network save failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
 
     def remove(self, force=False):
         self._ensure_exists()
@@ -75,6 +81,7 @@ class Network(object):
         auth_api_request.action('network/delete')
         auth_api_request.param('force', force)
         auth_api_request.execute('Network remove failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
         self._id = None
         self.name = None
         self.description = None
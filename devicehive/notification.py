@@ -23,6 +23,11 @@ class Notification(object):
     PARAMETERS_KEY = 'parameters'
     TIMESTAMP_KEY = 'timestamp'
 
+    # TODO: decode parameters lazily. The data formats decode a message in
+    # one call, so this needs a decoder that keeps the raw parameters text.
+    __slots__ = ('_device_id', '_id', '_notification', '_parameters',
+                 '_timestamp')
+
     def __init__(self, notification):
         self._device_id = notification[self.DEVICE_ID_KEY]
         self._id = notification[self.ID_KEY]
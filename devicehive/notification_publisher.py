@@ -0,0 +1,209 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.api_request import ApiRequestError
+from devicehive.notification import Notification
+from devicehive.timestamps import utc_timestamp
+import numbers
+import threading
+import logging
+import time
+import six
+
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationPublisher(object):
+    """Notification publisher class."""
+
+    AGGREGATE_MODE = 'aggregate'
+    SAMPLES_MODE = 'samples'
+    BATCH_MODE = 'batch'
+
+    def __init__(self, api, window=1.0, max_count=100, mode=AGGREGATE_MODE,
+                 pipeline_window=16):
+        assert window > 0, 'Publisher window must be positive'
+        assert max_count > 0, 'Publisher max count must be positive'
+        assert mode in (self.AGGREGATE_MODE, self.SAMPLES_MODE,
+                        self.BATCH_MODE), 'Unexpected publisher mode'
+        self._api = api
+        self._window = window
+        self._max_count = max_count
+        self._mode = mode
+        self._pipeline_window = pipeline_window
+        self._buffers = {}
+        self._full_buffers = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._num_readings = 0
+        self._num_notifications = 0
+        self._thread = threading.Thread(target=self._publisher)
+        self._thread.name = 'notification-publisher'
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _aggregate(readings):
+        values = {}
+        for _, parameters in readings:
+            if not isinstance(parameters, dict):
+                parameters = {'value': parameters}
+            for key, value in six.iteritems(parameters):
+                values.setdefault(key, []).append(value)
+        aggregates = {}
+        for key, key_values in six.iteritems(values):
+            aggregate = {'last': key_values[-1]}
+            key_numbers = [value for value in key_values
+                           if isinstance(value, numbers.Number) and
+                           not isinstance(value, bool)]
+            if key_numbers:
+                aggregate['min'] = min(key_numbers)
+                aggregate['max'] = max(key_numbers)
+                aggregate['mean'] = sum(key_numbers) / float(len(key_numbers))
+            aggregates[key] = aggregate
+        return {'count': len(readings),
+                'start': readings[0][0],
+                'end': readings[-1][0],
+                'parameters': aggregates}
+
+    @staticmethod
+    def _samples(readings):
+        return {'count': len(readings),
+                'start': readings[0][0],
+                'end': readings[-1][0],
+                'samples': [{'timestamp': timestamp, 'parameters': parameters}
+                            for timestamp, parameters in readings]}
+
+    def _send(self, buffers):
+        if self._mode == self.BATCH_MODE:
+            notifications = [{Notification.DEVICE_ID_KEY: device_id,
+                              Notification.NOTIFICATION_KEY: notification_name,
+                              Notification.PARAMETERS_KEY: parameters,
+                              Notification.TIMESTAMP_KEY: timestamp}
+                             for (device_id, notification_name), readings
+                             in buffers
+                             for timestamp, parameters in readings]
+            futures = self._api.send_bulk_notifications(notifications,
+                                                        self._pipeline_window)
+            for future in futures:
+                if future.exception():
+                    logger.warning('Notification publish failure: %s',
+                                   future.exception())
+            with self._condition:
+                self._num_notifications += len(notifications)
+            return
+        for (device_id, notification_name), readings in buffers:
+            if self._mode == self.AGGREGATE_MODE:
+                parameters = self._aggregate(readings)
+            else:
+                parameters = self._samples(readings)
+            try:
+                self._api.send_notification(device_id, notification_name,
+                                            parameters)
+            except Exception:
+                logger.warning('Notification publish failure.', exc_info=True)
+            with self._condition:
+                self._num_notifications += 1
+
+    def _ready_buffers(self, force):
+        now = time.time()
+        keys = [key for key, buffer in six.iteritems(self._buffers)
+                if force or buffer['deadline'] <= now]
+        buffers = self._full_buffers
+        self._full_buffers = []
+        buffers.extend((key, self._buffers.pop(key)['readings'])
+                       for key in keys)
+        return buffers
+
+    def _publisher(self):
+        while True:
+            with self._condition:
+                buffers = self._ready_buffers(self._closed)
+                while not buffers:
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._buffers:
+                        timeout = min(buffer['deadline'] for buffer
+                                      in self._buffers.values()) - time.time()
+                    self._condition.wait(timeout)
+                    buffers = self._ready_buffers(self._closed)
+            self._send(buffers)
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def max_count(self):
+        return self._max_count
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def stats(self):
+        with self._condition:
+            return {'readings': self._num_readings,
+                    'notifications': self._num_notifications,
+                    'buffers': len(self._buffers) + len(self._full_buffers)}
+
+    def publish(self, device_id, notification_name, parameters=None):
+        timestamp = utc_timestamp()
+        with self._condition:
+            if self._closed:
+                raise NotificationPublisherError('Publisher is closed.')
+            self._num_readings += 1
+            key = (device_id, notification_name)
+            buffer = self._buffers.get(key)
+            if not buffer:
+                buffer = {'deadline': time.time() + self._window,
+                          'readings': []}
+                self._buffers[key] = buffer
+                self._condition.notify()
+            buffer['readings'].append((timestamp, parameters))
+            if len(buffer['readings']) < self._max_count:
+                return
+            self._full_buffers.append((key, self._buffers.pop(key)['readings']))
+            self._condition.notify()
+
+    def flush(self):
+        with self._condition:
+            buffers = self._ready_buffers(True)
+        if buffers:
+            self._send(buffers)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+
+class NotificationPublisherError(ApiRequestError):
+    """Notification publisher error."""
@@ -0,0 +1,134 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.device_hive_api import DeviceHiveApi
+from devicehive.notification import Notification
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
+import time
+import zlib
+import six
+
+
+class ShardedDeviceHiveApi(DeviceHiveApi):
+    """Sharded device hive api class."""
+
+    DEVICE_CALLS = ('get_device', 'put_device', 'list_commands',
+                    'send_command', 'send_command_future',
+                    'list_notifications', 'send_notification',
+                    'send_notifications')
+
+    def __init__(self, transport_urls, num_shards=None, **options):
+        if isinstance(transport_urls, six.string_types):
+            transport_urls = [transport_urls]
+        if not num_shards:
+            num_shards = len(transport_urls)
+        assert num_shards > 0, 'Number of shards must be positive'
+        options['persistent'] = True
+        self._persistent = True
+        self._transport_urls = list(transport_urls)
+        self._shards = [DeviceHiveApi(transport_urls[i % len(transport_urls)],
+                                      **dict(options))
+                        for i in range(num_shards)]
+        self._shard_counter = itertools.count()
+        self._num_calls = [0] * num_shards
+        self._num_errors = [0] * num_shards
+        self._call_time = [0.0] * num_shards
+        self._stats_lock = threading.Lock()
+
+    def _device_shard(self, device_id):
+        if not isinstance(device_id, six.binary_type):
+            device_id = six.text_type(device_id).encode('utf-8')
+        return zlib.crc32(device_id) % len(self._shards)
+
+    def _call_shard(self, call, args, kwargs):
+        if call not in self.DEVICE_CALLS:
+            return next(self._shard_counter) % len(self._shards)
+        device_id = kwargs.get('device_id')
+        if device_id is None and args:
+            device_id = args[0]
+        if device_id is None:
+            raise TypeError('%s() requires a device_id.' % call)
+        return self._device_shard(device_id)
+
+    def _shard_call(self, shard, call, *args, **kwargs):
+        start_time = time.time()
+        try:
+            return self._shards[shard]._call(call, *args, **kwargs)
+        except Exception:
+            with self._stats_lock:
+                self._num_errors[shard] += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self._num_calls[shard] += 1
+                self._call_time[shard] += time.time() - start_time
+
+    def _call(self, call, *args, **kwargs):
+        shard = self._call_shard(call, args, kwargs)
+        return self._shard_call(shard, call, *args, **kwargs)
+
+    @property
+    def num_shards(self):
+        return len(self._shards)
+
+    @property
+    def transport_url(self):
+        return self._transport_urls[0]
+
+    @property
+    def transport_urls(self):
+        return list(self._transport_urls)
+
+    @property
+    def num_connects(self):
+        return sum(shard.num_connects for shard in self._shards)
+
+    @property
+    def stats(self):
+        with self._stats_lock:
+            return [{'transport_url': shard.transport_url,
+                     'calls': self._num_calls[i],
+                     'errors': self._num_errors[i],
+                     'call_time': self._call_time[i],
+                     'connects': shard.num_connects}
+                    for i, shard in enumerate(self._shards)]
+
+    def close(self):
+        [shard.close() for shard in self._shards]
+
+    def send_bulk_notifications(self, notifications, window=16):
+        notifications = list(notifications)
+        shard_notifications = [[] for _ in self._shards]
+        for i, notification in enumerate(notifications):
+            device_id = notification[Notification.DEVICE_ID_KEY]
+            shard_notifications[self._device_shard(device_id)].append(
+                (i, notification))
+        futures = [None] * len(notifications)
+        with ThreadPoolExecutor(len(self._shards)) as executor:
+            shard_futures = [
+                (indexed_notifications, executor.submit(
+                    self._shard_call, shard, 'send_bulk_notifications',
+                    [notification for _, notification
+                     in indexed_notifications], window))
+                for shard, indexed_notifications
+                in enumerate(shard_notifications) if indexed_notifications]
+        for indexed_notifications, shard_future in shard_futures:
+            for (i, _), future in zip(indexed_notifications,
+                                      shard_future.result()):
+                futures[i] = future
+        return futures
@@ -50,6 +50,9 @@ class BaseSubscription(object):
         subscription = self._call(*self._args)
         self._id = subscription[self.ID_KEY]
 
+    def clear_timestamp(self):
+        self._args = self._args[:-1] + (None,)
+
     @property
     def id(self):
         return self._id
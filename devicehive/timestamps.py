@@ -14,25 +14,19 @@
 # =============================================================================
 
 
-class ApiEvent(object):
-    """Api event class."""
+from datetime import datetime
 
-    EVENT_ACTION_KEY = 'action'
-    EVENT_SUBSCRIPTION_ID_KEY = 'subscriptionId'
 
-    def __init__(self, event):
-        self._action = event.pop(self.EVENT_ACTION_KEY)
-        self._subscription_id = event.pop(self.EVENT_SUBSCRIPTION_ID_KEY)
-        self._event = event
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
 
-    @property
-    def action(self):
-        return self._action
 
-    @property
-    def subscription_id(self):
-        return self._subscription_id
+def format_timestamp(date_time):
+    return date_time.strftime(TIMESTAMP_FORMAT)[:-3]
 
-    @property
-    def event(self):
-        return self._event
+
+def parse_timestamp(timestamp):
+    return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+
+
+def utc_timestamp():
+    return format_timestamp(datetime.utcnow())
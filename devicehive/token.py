@@ -16,6 +16,14 @@
 
 from devicehive.api_request import ApiRequest
 from devicehive.api_request import ApiRequestError
+import threading
+import logging
+import base64
+import json
+import time
+
+
+logger = logging.getLogger(__name__)
 
 
 class Token(object):
@@ -30,6 +38,9 @@ class Token(object):
         self._password = auth.get('password')
         self._refresh_token = auth.get('refresh_token')
         self._access_token = auth.get('access_token')
+        self._refresh_margin = auth.get('refresh_margin', 60)
+        self._auth_lock = threading.Lock()
+        self._refresh_timer = None
 
     def _auth(self):
         api_request = ApiRequest(self._api)
@@ -50,10 +61,65 @@ class Token(object):
         self._refresh_token = tokens['refreshToken']
         self._access_token = tokens['accessToken']
 
+    @staticmethod
+    def _expiration_time(access_token):
+        try:
+            payload = access_token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            payload = base64.urlsafe_b64decode(payload.encode('ascii'))
+            payload = json.loads(payload.decode('utf-8'))
+            if 'exp' in payload:
+                return float(payload['exp'])
+            return payload['payload']['e'] / 1000.0
+        except Exception:
+            return None
+
+    def _schedule_refresh(self):
+        self.cancel_refresh()
+        if self._refresh_margin is None or not self._refresh_token:
+            return
+        expiration_time = self._expiration_time(self._access_token)
+        if not expiration_time:
+            return
+        lifetime = expiration_time - time.time()
+        delay = max(lifetime - self._refresh_margin, lifetime / 2, 1)
+        self._refresh_timer = threading.Timer(delay, self._background_refresh,
+                                              args=(self._access_token,))
+        self._refresh_timer.name = 'token-refresh'
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self, access_token):
+        try:
+            self.auth(access_token)
+        except Exception:
+            logger.warning('Background token refresh failure.', exc_info=True)
+
+    def _authenticate(self):
+        if self._refresh_token:
+            self.refresh()
+            self._auth()
+            return
+        if self._access_token:
+            self._auth()
+            return
+        if self._login and self._password:
+            self._tokens()
+            self._auth()
+            return
+        if self._login:
+            raise TokenError('Password required.')
+        if self._password:
+            raise TokenError('Login required.')
+
     @property
     def access_token(self):
         return self._access_token
 
+    @property
+    def expiration_time(self):
+        return self._expiration_time(self._access_token)
+
     @property
     def auth_header(self):
         auth_header_name = self.AUTH_HEADER_NAME
@@ -71,22 +137,18 @@ class Token(object):
         tokens = api_request.execute('Token refresh failure.')
         self._access_token = tokens['accessToken']
 
-    def auth(self):
-        if self._refresh_token:
-            self.refresh()
-            self._auth()
-            return
-        if self._access_token:
-            self._auth()
-            return
-        if self._login and self._password:
-            self._tokens()
-            self._auth()
+    def auth(self, access_token=None):
+        with self._auth_lock:
+            if access_token and access_token != self._access_token:
+                return
+            self._authenticate()
+            self._schedule_refresh()
+
+    def cancel_refresh(self):
+        if not self._refresh_timer:
             return
-        if self._login:
-            raise TokenError('Password required.')
-        if self._password:
-            raise TokenError('Login required.')
+        self._refresh_timer.cancel()
+        self._refresh_timer = None
 
 
 class TokenError(ApiRequestError):
@@ -0,0 +1,118 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.transports.transport import Transport
+from devicehive.transports.event_queue import EventQueue
+import asyncio
+import sys
+
+
+class AsyncTransport(Transport):
+    """Async transport class."""
+
+    EVENTS_QUEUE_BLOCKING = False
+
+    def __init__(self, name, error, data_format_class, data_format_options,
+                 handler_class, handler_options):
+        super(AsyncTransport, self).__init__(name, error, data_format_class,
+                                             data_format_options, handler_class,
+                                             handler_options)
+        self._connection_task = None
+        self._events_queue = None
+        self._events_queue_overflow_policy = None
+        self._num_dropped_events = 0
+
+    async def _handle_connect(self):
+        await self._handler.handle_connect()
+
+    async def _handle_event(self, event):
+        await self._handler.handle_event(event)
+
+    async def _handle_disconnect(self):
+        await self._handler.handle_disconnect()
+
+    async def _connection(self, url, options):
+        try:
+            await self._connect(url, **options)
+            await self._receive()
+            await self._disconnect()
+        except Exception:
+            self._exception_info = sys.exc_info()
+
+    async def _connect(self, url, **options):
+        raise NotImplementedError
+
+    async def _receive(self):
+        while self._connected and not self._exception_info:
+            event = await self._events_queue.get()
+            if event is None:
+                continue
+            await self._handle_event(event)
+
+    async def _disconnect(self):
+        raise NotImplementedError
+
+    def connect(self, url, **options):
+        self._ensure_not_connected()
+        events_queue_max_size = options.pop('events_queue_max_size', 0)
+        events_queue_overflow_policy = options.pop(
+            'events_queue_overflow_policy', EventQueue.BLOCK_OVERFLOW_POLICY)
+        assert events_queue_overflow_policy in EventQueue.OVERFLOW_POLICIES, \
+            'Unexpected overflow policy'
+        self._ensure_events_queue_options(events_queue_max_size,
+                                          events_queue_overflow_policy)
+        self._events_queue = asyncio.Queue(events_queue_max_size)
+        self._events_queue_overflow_policy = events_queue_overflow_policy
+        self._connection_task = asyncio.ensure_future(
+            self._connection(url, options))
+
+    def disconnect(self):
+        self._ensure_connected()
+        self._connected = False
+        self._interrupt_receive()
+
+    def _put_event(self, event):
+        try:
+            self._events_queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self._num_dropped_events += 1
+        if self._events_queue_overflow_policy == \
+                EventQueue.DROP_NEWEST_OVERFLOW_POLICY:
+            return False
+        self._events_queue.get_nowait()
+        self._events_queue.put_nowait(event)
+        return True
+
+    @property
+    def num_dropped_events(self):
+        return self._num_dropped_events
+
+    def _interrupt_receive(self):
+        if self._events_queue.empty():
+            self._events_queue.put_nowait(None)
+
+    async def join(self, timeout=None):
+        await asyncio.wait([self._connection_task], timeout=timeout)
+
+    def is_alive(self):
+        return not self._connection_task.done()
+
+    async def send_request(self, request_id, action, request, **params):
+        raise NotImplementedError
+
+    async def request(self, request_id, action, request, **params):
+        raise NotImplementedError
@@ -0,0 +1,148 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.transports.async_transport import AsyncTransport
+from devicehive.transports.transport import TransportError
+import aiohttp
+import asyncio
+import sys
+
+
+class AsyncWebsocketTransport(AsyncTransport):
+    """Async websocket transport class."""
+
+    def __init__(self, data_format_class, data_format_options, handler_class,
+                 handler_options):
+        super(AsyncWebsocketTransport, self).__init__(
+            'websocket', AsyncWebsocketTransportError, data_format_class,
+            data_format_options, handler_class, handler_options)
+        self._session = None
+        self._websocket = None
+        self._event_task = None
+        self._responses = {}
+        if self._text_data_type:
+            self._send_method_name = 'send_str'
+        else:
+            self._send_method_name = 'send_bytes'
+
+    async def _websocket_call(self, websocket_method, *args, **kwargs):
+        try:
+            return await websocket_method(*args, **kwargs)
+        except (aiohttp.ClientError, asyncio.TimeoutError,
+                OSError) as websocket_error:
+            error = websocket_error
+        raise self._error(error)
+
+    async def _connect(self, url, **options):
+        timeout = options.pop('timeout', None)
+        pong_timeout = options.pop('pong_timeout', None)
+        self._session = aiohttp.ClientSession()
+        try:
+            self._websocket = await self._websocket_call(
+                self._session.ws_connect, url, receive_timeout=timeout,
+                heartbeat=pong_timeout, **options)
+        except self._error:
+            await self._session.close()
+            raise
+        self._connected = True
+        self._event_task = asyncio.ensure_future(self._event())
+        await self._handle_connect()
+
+    async def _event(self):
+        while self._connected:
+            try:
+                message = await self._websocket_call(self._websocket.receive)
+                if message.type in (aiohttp.WSMsgType.TEXT,
+                                    aiohttp.WSMsgType.BINARY):
+                    event = self._decode(message.data)
+                    request_id = event.get(self.REQUEST_ID_KEY)
+                    if not request_id:
+                        self._put_event(event)
+                        continue
+                    self._set_response(request_id, event)
+                    continue
+                if message.type in (aiohttp.WSMsgType.CLOSE,
+                                    aiohttp.WSMsgType.CLOSING,
+                                    aiohttp.WSMsgType.CLOSED,
+                                    aiohttp.WSMsgType.ERROR):
+                    self._connected = False
+                    self._cancel_responses()
+                    self._interrupt_receive()
+                    return
+            except Exception:
+                self._exception_info = sys.exc_info()
+                self._cancel_responses()
+                self._interrupt_receive()
+                return
+
+    async def _disconnect(self):
+        self._event_task.cancel()
+        try:
+            await self._websocket_call(self._websocket.close)
+            await self._session.close()
+        finally:
+            self._cancel_responses()
+        await self._handle_disconnect()
+
+    def _set_response(self, request_id, event):
+        response = self._responses.pop(request_id, None)
+        if not response or response.done():
+            return
+        response.set_result(event)
+
+    def _cancel_responses(self):
+        responses = self._responses
+        self._responses = {}
+        for response in responses.values():
+            if response.done():
+                continue
+            response.set_exception(self._error('Connection has been closed.'))
+
+    async def _send_request(self, request_id, action, request):
+        request[self.REQUEST_ID_KEY] = request_id
+        request[self.REQUEST_ACTION_KEY] = action
+        send_method = getattr(self._websocket, self._send_method_name)
+        await self._websocket_call(send_method, self._encode(request))
+
+    async def _receive_response(self, request_id, response, timeout):
+        try:
+            return await asyncio.wait_for(response, timeout)
+        except asyncio.TimeoutError:
+            self._responses.pop(request_id, None)
+        raise self._error('Response timeout.')
+
+    async def send_request(self, request_id, action, request, **params):
+        self._ensure_connected()
+        await self._send_request(request_id, action, request)
+
+    async def request(self, request_id, action, request, **params):
+        self._ensure_connected()
+        timeout = params.pop('timeout', 30)
+        response = asyncio.get_event_loop().create_future()
+        self._responses[request_id] = response
+        if self._exception_info or not self._connected:
+            self._responses.pop(request_id, None)
+            raise self._error('Connection has been closed.')
+        try:
+            await self._send_request(request_id, action, request)
+        except self._error:
+            self._responses.pop(request_id, None)
+            raise
+        return await self._receive_response(request_id, response, timeout)
+
+
+class AsyncWebsocketTransportError(TransportError):
+    """Async websocket transport error."""
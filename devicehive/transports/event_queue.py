@@ -0,0 +1,92 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import collections
+import threading
+
+
+class EventQueue(object):
+    """Event queue class."""
+
+    BLOCK_OVERFLOW_POLICY = 'block'
+    DROP_OLDEST_OVERFLOW_POLICY = 'drop_oldest'
+    DROP_NEWEST_OVERFLOW_POLICY = 'drop_newest'
+    OVERFLOW_POLICIES = (BLOCK_OVERFLOW_POLICY, DROP_OLDEST_OVERFLOW_POLICY,
+                         DROP_NEWEST_OVERFLOW_POLICY)
+
+    def __init__(self, max_size=0, overflow_policy=BLOCK_OVERFLOW_POLICY):
+        assert overflow_policy in self.OVERFLOW_POLICIES, \
+            'Unexpected overflow policy'
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._events = collections.deque()
+        self._condition = threading.Condition()
+        self._interrupted = False
+        self._num_dropped = 0
+
+    def __len__(self):
+        return len(self._events)
+
+    def _full(self):
+        return self._max_size and len(self._events) >= self._max_size
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def overflow_policy(self):
+        return self._overflow_policy
+
+    @property
+    def num_dropped(self):
+        return self._num_dropped
+
+    def put(self, event):
+        with self._condition:
+            if self._full():
+                if self._overflow_policy == self.DROP_NEWEST_OVERFLOW_POLICY:
+                    self._num_dropped += 1
+                    return False
+                if self._overflow_policy == self.DROP_OLDEST_OVERFLOW_POLICY:
+                    self._events.popleft()
+                    self._num_dropped += 1
+                while self._full():
+                    self._condition.wait()
+            self._events.append(event)
+            self._condition.notify_all()
+            return True
+
+    def get(self):
+        with self._condition:
+            while not self._events:
+                if self._interrupted:
+                    self._interrupted = False
+                    return None
+                self._condition.wait()
+            event = self._events.popleft()
+            self._condition.notify_all()
+            return event
+
+    def interrupt(self):
+        with self._condition:
+            self._interrupted = True
+            self._condition.notify_all()
+
+    def clear(self):
+        with self._condition:
+            self._events.clear()
+            self._condition.notify_all()
@@ -0,0 +1,148 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import aiohttp
+import asyncio
+import threading
+import sys
+
+
+class HttpPollReactor(object):
+    """Http poll reactor class."""
+
+    def __init__(self, name, error, options):
+        self._name = name
+        self._error = error
+        self._timeout = aiohttp.ClientTimeout(total=options.get('timeout'))
+        if options.get('verify', True):
+            self._ssl = None
+        else:
+            self._ssl = False
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._subscriptions = {}
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _open(self):
+        connector = aiohttp.TCPConnector(limit=0)
+        self._session = aiohttp.ClientSession(connector=connector)
+
+    async def _close(self):
+        subscriptions = list(self._subscriptions.values())
+        self._subscriptions = {}
+        for subscription in subscriptions:
+            subscription.cancel()
+        await asyncio.gather(*subscriptions, return_exceptions=True)
+        await self._session.close()
+
+    async def _request_call(self, text_data_type, method, url, params=None,
+                            headers=None, data=None):
+        if params:
+            params = {key: str(value) for key, value in params.items()}
+        try:
+            async with self._session.request(method, url, params=params,
+                                             headers=headers, data=data,
+                                             timeout=self._timeout,
+                                             ssl=self._ssl) as response:
+                if text_data_type:
+                    return response.status, await response.text()
+                return response.status, await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as http_error:
+            error = http_error
+        raise self._error(error)
+
+    async def _request(self, transport, request_id, action, request, params):
+        method, url, response_key, params = transport._request_args(
+            request, dict(params))
+        code, data = await self._request_call(transport._text_data_type,
+                                              method, url, **params)
+        return transport._response(request_id, action, response_key, code,
+                                   data)
+
+    async def _subscription(self, transport, subscription_id, request_id,
+                            action, request, params):
+        options = transport._subscription_options(params)
+        try:
+            while True:
+                transport._subscription_params(subscription_id, params,
+                                               options)
+                response = await self._request(transport, request_id, action,
+                                               request.copy(), params)
+                response_error = await self._loop.run_in_executor(
+                    None, transport._subscription_response_error, action,
+                    params, response, options)
+                if response_error:
+                    response = await self._request(transport, request_id,
+                                                   action, request.copy(),
+                                                   params)
+                    transport._ensure_subscription_response_success(action,
+                                                                    response)
+                await self._loop.run_in_executor(
+                    None, transport._subscription_events, subscription_id,
+                    action, params, response, options)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._subscriptions.pop(subscription_id, None)
+            transport._subscription_exception(sys.exc_info())
+
+    def _add_subscription(self, transport, subscription_id, request_id, action,
+                          request, params):
+        subscription = self._loop.create_task(
+            self._subscription(transport, subscription_id, request_id, action,
+                               request, params))
+        self._subscriptions[subscription_id] = subscription
+
+    def _remove_subscription(self, subscription_id):
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if not subscription:
+            return
+        subscription.cancel()
+
+    @property
+    def num_subscriptions(self):
+        return len(self._subscriptions)
+
+    def start(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.name = '%s-transport-poll-reactor' % self._name
+        self._thread.daemon = True
+        self._thread.start()
+        self._call(self._open())
+
+    def stop(self):
+        self._call(self._close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def add_subscription(self, transport, subscription_id, request_id, action,
+                         request, params):
+        self._loop.call_soon_threadsafe(self._add_subscription, transport,
+                                        subscription_id, request_id, action,
+                                        request, params)
+
+    def remove_subscription(self, subscription_id):
+        self._loop.call_soon_threadsafe(self._remove_subscription,
+                                        subscription_id)
@@ -16,6 +16,7 @@
 
 from devicehive.transports.transport import Transport
 from devicehive.transports.transport import TransportError
+from requests.adapters import HTTPAdapter
 import requests
 import threading
 import sys
@@ -33,41 +34,83 @@ class HttpTransport(Transport):
                                             handler_options)
         self._url = None
         self._options = None
-        self._events_queue_sleep = None
-        self._events_queue = []
-        self._subscription_ids = []
+        self._session = None
+        self._session_idle_timeout = None
+        self._session_used_time = None
+        self._reactor = None
+        self._subscription_ids = set()
+        self._subscription_coalescing = False
+        self._subscription_groups = {}
+        self._subscription_group_keys = {}
+        self._subscription_groups_lock = threading.Lock()
         self._success_codes = [200, 201, 204]
 
     def _connect(self, url, **options):
         self._url = url
+        pool_connections = options.pop('pool_connections', 10)
+        pool_maxsize = options.pop('pool_maxsize', 10)
+        pool_block = options.pop('pool_block', False)
+        self._session_idle_timeout = options.pop('pool_idle_timeout', None)
+        subscription_reactor = options.pop('subscription_reactor', False)
+        self._subscription_coalescing = options.pop('subscription_coalescing',
+                                                    False)
         self._options = options
-        self._events_queue_sleep_time = options.pop('events_queue_sleep_time',
-                                                    1e-6)
+        self._session = self._create_session(pool_connections, pool_maxsize,
+                                             pool_block)
+        self._session_used_time = time.time()
+        if subscription_reactor:
+            self._reactor = self._create_reactor()
+            self._reactor.start()
         if not self._url.endswith('/'):
             self._url += '/'
         self._connected = True
         self._handle_connect()
 
-    def _receive(self):
-        while self._connected and not self._exception_info:
-            if not self._events_queue:
-                time.sleep(self._events_queue_sleep_time)
-                continue
-            for event in self._events_queue.pop(0):
-                self._handle_event(event)
-                if not self._connected:
-                    return
-
     def _disconnect(self):
-        self._events_queue = []
-        self._subscription_ids = []
+        if self._reactor:
+            self._reactor.stop()
+            self._reactor = None
+        self._events_queue.clear()
+        self._subscription_ids = set()
+        with self._subscription_groups_lock:
+            self._subscription_groups = {}
+            self._subscription_group_keys = {}
+        self._session.close()
         self._handle_disconnect()
 
+    @property
+    def subscription_coalescing(self):
+        return self._subscription_coalescing
+
+    def _create_reactor(self):
+        from devicehive.transports.http_poll_reactor import HttpPollReactor
+        return HttpPollReactor(self._name, self._error, self._options)
+
+    @staticmethod
+    def _create_session(pool_connections, pool_maxsize, pool_block):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _ensure_session_not_idle(self):
+        used_time = time.time()
+        idle_time = used_time - self._session_used_time
+        self._session_used_time = used_time
+        if self._session_idle_timeout is None:
+            return
+        if idle_time < self._session_idle_timeout:
+            return
+        self._session.close()
+
     def _request_call(self, method, url, **params):
         options = self._options.copy()
         options.update(params)
+        self._ensure_session_not_idle()
         try:
-            response = requests.request(method, url, **options)
+            response = self._session.request(method, url, **options)
             code = response.status_code
             if self._text_data_type:
                 return code, response.text
@@ -76,7 +119,7 @@ class HttpTransport(Transport):
             error = http_error
         raise self._error(error)
 
-    def _request(self, request_id, action, request, **params):
+    def _request_args(self, request, params):
         method = params.pop('method', 'GET')
         url = self._url + params.pop('url')
         request_delete_keys = params.pop('request_delete_keys', [])
@@ -88,7 +131,9 @@ class HttpTransport(Transport):
             if request_key:
                 request = request[request_key]
             params['data'] = self._encode(request)
-        code, data = self._request_call(method, url, **params)
+        return method, url, response_key, params
+
+    def _response(self, request_id, action, response_key, code, data):
         response = {self.REQUEST_ID_KEY: request_id,
                     self.REQUEST_ACTION_KEY: action}
         if code in self._success_codes:
@@ -111,13 +156,31 @@ class HttpTransport(Transport):
         response[self.RESPONSE_ERROR_KEY] = response_error
         return response
 
+    def _request(self, request_id, action, request, **params):
+        method, url, response_key, params = self._request_args(request, params)
+        code, data = self._request_call(method, url, **params)
+        return self._response(request_id, action, response_key, code, data)
+
     def _subscription_request(self, request_id, action, subscription_request,
                               response_subscription_id_key):
         response = self._subscription_probe(**subscription_request)
         if response[self.RESPONSE_STATUS_KEY] != self.RESPONSE_SUCCESS_STATUS:
             return response
         subscription_id = subscription_request['subscription_id']
-        self._subscription_ids.append(subscription_id)
+        if not self._subscription_coalescing or \
+                not self._coalesce_subscription(**subscription_request):
+            self._start_subscription(subscription_request)
+        return {self.REQUEST_ID_KEY: request_id,
+                self.REQUEST_ACTION_KEY: action,
+                self.RESPONSE_STATUS_KEY: self.RESPONSE_SUCCESS_STATUS,
+                response_subscription_id_key: subscription_id}
+
+    def _start_subscription(self, subscription_request):
+        subscription_id = subscription_request['subscription_id']
+        self._subscription_ids.add(subscription_id)
+        if self._reactor:
+            self._reactor.add_subscription(self, **subscription_request)
+            return
         subscription_thread_name = '%s-transport-subscription-%s'
         subscription_thread_name %= (self._name, subscription_id)
         subscription_thread = threading.Thread(target=self._subscription,
@@ -125,10 +188,94 @@ class HttpTransport(Transport):
         subscription_thread.daemon = True
         subscription_thread.name = subscription_thread_name
         subscription_thread.start()
-        return {self.REQUEST_ID_KEY: request_id,
-                self.REQUEST_ACTION_KEY: action,
-                self.RESPONSE_STATUS_KEY: self.RESPONSE_SUCCESS_STATUS,
-                response_subscription_id_key: subscription_id}
+
+    @staticmethod
+    def _subscription_group_key(action, params):
+        query_params = params.get('params', {})
+        return (action, params['url'], query_params.get('deviceTypeIds'),
+                query_params.get('names'),
+                query_params.get('returnUpdatedCommands'))
+
+    def _coalesce_subscription(self, subscription_id, request_id, action,
+                               request, params):
+        query_params = params.get('params', {})
+        network_ids = query_params.get('networkIds')
+        if not network_ids:
+            return False
+        group_key = self._subscription_group_key(action, params)
+        member = {'device_id': query_params.get('deviceId'),
+                  'network_ids': set(str(network_id).strip() for network_id
+                                     in network_ids.split(',')),
+                  'timestamp': query_params.get(
+                      params.get('params_timestamp_key', 'timestamp'))}
+        with self._subscription_groups_lock:
+            self._subscription_group_keys[subscription_id] = group_key
+            group = self._subscription_groups.get(group_key)
+            if group:
+                group['members'][subscription_id] = member
+                return True
+            group_id = 'group-%s' % subscription_id
+            group = {'id': group_id, 'members': {subscription_id: member}}
+            self._subscription_groups[group_key] = group
+            self._subscription_groups[group_id] = group
+        params = params.copy()
+        params['params'] = query_params.copy()
+        params['params'].pop('deviceId', None)
+        self._start_subscription({'subscription_id': group_id,
+                                  'request_id': request_id,
+                                  'action': action,
+                                  'request': request,
+                                  'params': params})
+        return True
+
+    def _remove_coalesced_subscription(self, subscription_id):
+        with self._subscription_groups_lock:
+            group_key = self._subscription_group_keys.pop(subscription_id,
+                                                          None)
+            if not group_key:
+                return False
+            group = self._subscription_groups[group_key]
+            del group['members'][subscription_id]
+            if group['members']:
+                return True
+            group_id = group['id']
+            del self._subscription_groups[group_key]
+            del self._subscription_groups[group_id]
+        self._subscription_ids.discard(group_id)
+        if self._reactor:
+            self._reactor.remove_subscription(group_id)
+        return True
+
+    def _subscription_group_members(self, subscription_id):
+        with self._subscription_groups_lock:
+            group = self._subscription_groups.get(subscription_id)
+            if not group:
+                return None
+            return list(group['members'].items())
+
+    def _subscription_params(self, subscription_id, params, options):
+        members = self._subscription_group_members(subscription_id)
+        if not members:
+            return
+        network_ids = set()
+        for _, member in members:
+            network_ids.update(member['network_ids'])
+        params['params']['networkIds'] = ','.join(sorted(network_ids))
+        timestamps = [member['timestamp'] for _, member in members
+                      if member['timestamp']]
+        if timestamps:
+            params['params'][options['params_timestamp_key']] = min(timestamps)
+
+    @staticmethod
+    def _subscription_member_event(member, event, timestamp):
+        if member['timestamp'] and timestamp <= member['timestamp']:
+            return False
+        if member['device_id'] and event.get('deviceId') != member['device_id']:
+            return False
+        network_id = event.get('networkId')
+        if network_id is None:
+            return True
+        return str(network_id) in member['network_ids']
 
     def _subscription_probe(self, subscription_id, request_id, action, request,
                             params):
@@ -138,62 +285,125 @@ class HttpTransport(Transport):
         params.pop('params_timestamp_key', None)
         params.pop('response_timestamp_key', None)
         params.pop('response_subscription_id_key', None)
-
+        params['params'] = params['params'].copy()
         params['params']['waitTimeout'] = 0
         params['params']['limit'] = 0
         return self._request(request_id, action, request.copy(), **params)
 
+    @staticmethod
+    def _subscription_options(params):
+        return {'response_error_handler': params.pop('response_error_handler',
+                                                     None),
+                'response_error_handler_args': params.pop(
+                    'response_error_handler_args', None),
+                'response_key': params['response_key'],
+                'params_timestamp_key': params.pop('params_timestamp_key',
+                                                   'timestamp'),
+                'response_timestamp_key': params.pop('response_timestamp_key',
+                                                     'timestamp'),
+                'response_subscription_id_key': params.pop(
+                    'response_subscription_id_key', 'subscriptionId')}
+
+    def _subscription_response_error(self, action, params, response,
+                                     options):
+        response_status = response[self.RESPONSE_STATUS_KEY]
+        if response_status == self.RESPONSE_SUCCESS_STATUS:
+            return False
+        response_code = response[self.RESPONSE_CODE_KEY]
+        error = 'Subscription request error. Action: %s. Code: %s.'
+        error %= (action, response_code)
+        response_error_handler = options['response_error_handler']
+        if not response_error_handler:
+            raise self._error(error)
+        if not response_error_handler(params, response_code,
+                                      *options['response_error_handler_args']):
+            raise self._error(error)
+        return True
+
+    def _ensure_subscription_response_success(self, action, response):
+        response_status = response[self.RESPONSE_STATUS_KEY]
+        if response_status == self.RESPONSE_SUCCESS_STATUS:
+            return
+        response_code = response[self.RESPONSE_CODE_KEY]
+        error = 'Subscription request error. Action: %s. Code: %s.'
+        error %= (action, response_code)
+        raise self._error(error)
+
+    def _subscription_events(self, subscription_id, action, params, response,
+                             options):
+        response_key = options['response_key']
+        events = response[response_key]
+        if not len(events):
+            return
+        timestamp = events[-1][options['response_timestamp_key']]
+        if not params.get('params'):
+            params['params'] = {}
+        params['params'][options['params_timestamp_key']] = timestamp
+        response_subscription_id_key = options['response_subscription_id_key']
+        members = self._subscription_group_members(subscription_id)
+        if members is not None:
+            self._subscription_group_events(action, events, members, timestamp,
+                                            options)
+            return
+        for event in events:
+            self._events_queue.put(
+                {self.REQUEST_ACTION_KEY: action,
+                 response_key: event,
+                 response_subscription_id_key: subscription_id})
+
+    def _subscription_group_events(self, action, events, members, timestamp,
+                                   options):
+        response_key = options['response_key']
+        response_timestamp_key = options['response_timestamp_key']
+        response_subscription_id_key = options['response_subscription_id_key']
+        for event in events:
+            event_timestamp = event[response_timestamp_key]
+            for member_id, member in members:
+                if not self._subscription_member_event(member, event,
+                                                       event_timestamp):
+                    continue
+                self._events_queue.put(
+                    {self.REQUEST_ACTION_KEY: action,
+                     response_key: event,
+                     response_subscription_id_key: member_id})
+        with self._subscription_groups_lock:
+            for _, member in members:
+                if not member['timestamp'] or member['timestamp'] < timestamp:
+                    member['timestamp'] = timestamp
+
+    def _subscription_exception(self, exception_info):
+        self._exception_info = exception_info
+        self._events_queue.interrupt()
+
     def _subscription(self, subscription_id, request_id, action, request,
                       params):
-        response_error_handler = params.pop('response_error_handler', None)
-        response_error_handler_args = params.pop('response_error_handler_args',
-                                                 None)
-        response_key = params['response_key']
-        params_timestamp_key = params.pop('params_timestamp_key', 'timestamp')
-        response_timestamp_key = params.pop('response_timestamp_key',
-                                            'timestamp')
-        response_subscription_id_key = params.pop(
-            'response_subscription_id_key', 'subscriptionId')
+        options = self._subscription_options(params)
         while subscription_id in self._subscription_ids:
             try:
+                self._subscription_params(subscription_id, params, options)
                 response = self._request(request_id, action, request.copy(),
                                          **params)
                 if subscription_id not in self._subscription_ids:
                     return
-                response_status = response[self.RESPONSE_STATUS_KEY]
-                if response_status != self.RESPONSE_SUCCESS_STATUS:
-                    response_code = response[self.RESPONSE_CODE_KEY]
-                    error = 'Subscription request error. Action: %s. Code: %s.'
-                    error %= (action, response_code)
-                    if not response_error_handler:
-                        raise self._error(error)
-                    if not response_error_handler(params, response_code,
-                                                  *response_error_handler_args):
-                        raise self._error(error)
+                if self._subscription_response_error(action, params, response,
+                                                     options):
                     response = self._request(request_id, action, request.copy(),
                                              **params)
                     if subscription_id not in self._subscription_ids:
                         return
-                    response_status = response[self.RESPONSE_STATUS_KEY]
-                    if response_status != self.RESPONSE_SUCCESS_STATUS:
-                        raise self._error(error)
-                events = response[response_key]
-                if not len(events):
-                    continue
-                timestamp = events[-1][response_timestamp_key]
-                if not params.get('params'):
-                    params['params'] = {}
-                params['params'][params_timestamp_key] = timestamp
-                events = [{self.REQUEST_ACTION_KEY: action,
-                           response_key: event,
-                           response_subscription_id_key: subscription_id}
-                          for event in events]
-                self._events_queue.append(events)
+                    self._ensure_subscription_response_success(action,
+                                                               response)
+                self._subscription_events(subscription_id, action, params,
+                                          response, options)
             except:
-                self._exception_info = sys.exc_info()
+                self._subscription_exception(sys.exc_info())
 
     def _remove_subscription_request(self, request_id, action, subscription_id,
                                      response_code, response_error):
+        if self._remove_coalesced_subscription(subscription_id):
+            return {self.REQUEST_ID_KEY: request_id,
+                    self.REQUEST_ACTION_KEY: action,
+                    self.RESPONSE_STATUS_KEY: self.RESPONSE_SUCCESS_STATUS}
         if subscription_id not in self._subscription_ids:
             return {self.REQUEST_ID_KEY: request_id,
                     self.REQUEST_ACTION_KEY: action,
@@ -201,6 +411,8 @@ class HttpTransport(Transport):
                     self.RESPONSE_CODE_KEY: response_code,
                     self.RESPONSE_ERROR_KEY: response_error}
         self._subscription_ids.remove(subscription_id)
+        if self._reactor:
+            self._reactor.remove_subscription(subscription_id)
         return {self.REQUEST_ID_KEY: request_id,
                 self.REQUEST_ACTION_KEY: action,
                 self.RESPONSE_STATUS_KEY: self.RESPONSE_SUCCESS_STATUS}
@@ -221,7 +433,7 @@ class HttpTransport(Transport):
                 request_id, action, **remove_subscription_request)
         else:
             response = self._request(request_id, action, request, **params)
-        self._events_queue.append([response])
+        self._events_queue.put(response)
 
     def request(self, request_id, action, request, **params):
         self._ensure_connected()
@@ -14,6 +14,7 @@
 # =============================================================================
 
 
+from devicehive.transports.event_queue import EventQueue
 import sys
 import threading
 
@@ -28,6 +29,7 @@ class Transport(object):
     RESPONSE_STATUS_KEY = 'status'
     RESPONSE_CODE_KEY = 'code'
     RESPONSE_ERROR_KEY = 'error'
+    EVENTS_QUEUE_BLOCKING = True
 
     def __init__(self, name, error, data_format_class, data_format_options,
                  handler_class, handler_options):
@@ -36,6 +38,7 @@ class Transport(object):
         self._data_format = data_format_class(**data_format_options)
         self._handler = handler_class(self, **handler_options)
         self._connection_thread = None
+        self._events_queue = EventQueue()
         self._connected = False
         self._exception_info = None
 
@@ -72,6 +75,14 @@ class Transport(object):
             return
         raise self._error('Connection has not created.')
 
+    def _ensure_events_queue_options(self, max_size, overflow_policy):
+        if not max_size or self.EVENTS_QUEUE_BLOCKING:
+            return
+        if overflow_policy != EventQueue.BLOCK_OVERFLOW_POLICY:
+            return
+        raise self._error('Block events queue overflow policy is not '
+                          'supported by %s transport.' % self._name)
+
     def _connection(self, url, options):
         try:
             self._connect(url, **options)
@@ -84,7 +95,11 @@ class Transport(object):
         raise NotImplementedError
 
     def _receive(self):
-        raise NotImplementedError
+        while self._connected and not self._exception_info:
+            event = self._events_queue.get()
+            if event is None:
+                continue
+            self._handle_event(event)
 
     def _disconnect(self):
         raise NotImplementedError
@@ -111,6 +126,13 @@ class Transport(object):
 
     def connect(self, url, **options):
         self._ensure_not_connected()
+        events_queue_max_size = options.pop('events_queue_max_size', 0)
+        events_queue_overflow_policy = options.pop(
+            'events_queue_overflow_policy', EventQueue.BLOCK_OVERFLOW_POLICY)
+        self._ensure_events_queue_options(events_queue_max_size,
+                                          events_queue_overflow_policy)
+        self._events_queue = EventQueue(events_queue_max_size,
+                                        events_queue_overflow_policy)
         self._connection_thread = threading.Thread(target=self._connection,
                                                    args=(url, options))
         self._connection_thread.name = '%s-transport-connection' % self._name
@@ -120,6 +142,7 @@ class Transport(object):
     def disconnect(self):
         self._ensure_connected()
         self._connected = False
+        self._events_queue.interrupt()
 
     def join(self, timeout=None):
         self._connection_thread.join(timeout)
@@ -127,6 +150,9 @@ class Transport(object):
     def is_alive(self):
         return self._connection_thread.is_alive()
 
+    def in_connection_thread(self):
+        return threading.current_thread() is self._connection_thread
+
     def send_request(self, request_id, action, request, **params):
         raise NotImplementedError
 
@@ -16,6 +16,8 @@
 
 from devicehive.transports.transport import Transport
 from devicehive.transports.transport import TransportError
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import websocket
 import socket
 import threading
@@ -26,6 +28,8 @@ import time
 class WebsocketTransport(Transport):
     """Websocket transport class."""
 
+    EVENTS_QUEUE_BLOCKING = False
+
     def __init__(self, data_format_class, data_format_options, handler_class,
                  handler_options):
         super(WebsocketTransport, self).__init__('websocket',
@@ -33,12 +37,10 @@ class WebsocketTransport(Transport):
                                                  data_format_class,
                                                  data_format_options,
                                                  handler_class, handler_options)
-        self._websocket = websocket.WebSocket()
+        self._websocket = websocket.WebSocket(enable_multithread=True)
         self._connection_lock = threading.Lock()
-        self._event_queue_sleep_time = None
-        self._response_sleep_time = None
+        self._responses_lock = threading.Lock()
         self._pong_received = False
-        self._event_queue = []
         self._responses = {}
         if self._text_data_type:
             self._data_opcode = websocket.ABNF.OPCODE_TEXT
@@ -54,12 +56,8 @@ class WebsocketTransport(Transport):
 
     def _connect(self, url, **options):
         timeout = options.pop('timeout', None)
-        event_queue_sleep_time = options.pop('event_queue_sleep_time', 1e-6)
-        response_sleep_time = options.pop('response_sleep_time', 1e-6)
         pong_timeout = options.pop('pong_timeout', None)
         self._websocket.timeout = timeout
-        self._event_queue_sleep_time = event_queue_sleep_time
-        self._response_sleep_time = response_sleep_time
         self._websocket_call(self._websocket.connect, url, **options)
         self._connected = True
         event_thread = threading.Thread(target=self._event)
@@ -82,14 +80,15 @@ class WebsocketTransport(Transport):
                         self._websocket.recv_data, True)
                 if opcode in (websocket.ABNF.OPCODE_TEXT,
                               websocket.ABNF.OPCODE_BINARY):
-                    if opcode == websocket.ABNF.OPCODE_TEXT:
+                    if opcode == websocket.ABNF.OPCODE_TEXT and \
+                            not self._data_format.decode_text_bytes:
                         data = data.decode('utf-8')
                     event = self._decode(data)
                     request_id = event.get(self.REQUEST_ID_KEY)
                     if not request_id:
-                        self._event_queue.append(event)
+                        self._events_queue.put(event)
                         continue
-                    self._responses[request_id] = event
+                    self._set_response(request_id, event)
                     continue
                 if opcode == websocket.ABNF.OPCODE_PONG:
                     self._pong_received = True
@@ -98,6 +97,9 @@ class WebsocketTransport(Transport):
                     return
             except:
                 self._exception_info = sys.exc_info()
+                self._cancel_responses()
+                self._events_queue.interrupt()
+                return
 
     def _ping(self, pong_timeout):
         while self._connected:
@@ -105,31 +107,24 @@ class WebsocketTransport(Transport):
                 self._websocket_call(self._websocket.ping)
             except self._error:
                 self._connected = False
+                self._events_queue.interrupt()
                 return
             self._pong_received = False
             time.sleep(pong_timeout)
             if not self._pong_received:
                 self._connected = False
+                self._events_queue.interrupt()
                 return
 
-    def _receive(self):
-        while self._connected and not self._exception_info:
-            if not self._event_queue:
-                time.sleep(self._event_queue_sleep_time)
-                continue
-            for event in self._event_queue:
-                self._handle_event(event)
-                if not self._connected:
-                    return
-            self._event_queue = []
-
     def _disconnect(self):
-        self._websocket_call(self._websocket.ping)
-        with self._connection_lock:
-            self._websocket_call(self._websocket.close)
-        self._pong_received = False
-        self._event_queue = []
-        self._responses = {}
+        try:
+            self._websocket_call(self._websocket.ping)
+            with self._connection_lock:
+                self._websocket_call(self._websocket.close)
+        finally:
+            self._pong_received = False
+            self._events_queue.clear()
+            self._cancel_responses()
         self._handle_disconnect()
 
     def _send_request(self, request_id, action, request):
@@ -138,14 +133,34 @@ class WebsocketTransport(Transport):
         self._websocket_call(self._websocket.send, self._encode(request),
                              opcode=self._data_opcode)
 
-    def _receive_response(self, request_id, timeout):
-        start_time = time.time()
-        while time.time() - timeout < start_time:
-            response = self._responses.get(request_id)
-            if response:
-                del self._responses[request_id]
-                return response
-            time.sleep(self._response_sleep_time)
+    def _add_response(self, request_id):
+        response = Future()
+        with self._responses_lock:
+            self._responses[request_id] = response
+        return response
+
+    def _remove_response(self, request_id):
+        with self._responses_lock:
+            return self._responses.pop(request_id, None)
+
+    def _set_response(self, request_id, event):
+        response = self._remove_response(request_id)
+        if not response:
+            return
+        response.set_result(event)
+
+    def _cancel_responses(self):
+        with self._responses_lock:
+            responses = self._responses
+            self._responses = {}
+        for response in responses.values():
+            response.set_exception(self._error('Connection has been closed.'))
+
+    def _receive_response(self, request_id, response, timeout):
+        try:
+            return response.result(timeout)
+        except FutureTimeoutError:
+            self._remove_response(request_id)
         raise self._error('Response timeout.')
 
     def send_request(self, request_id, action, request, **params):
@@ -155,8 +170,16 @@ class WebsocketTransport(Transport):
     def request(self, request_id, action, request, **params):
         self._ensure_connected()
         timeout = params.pop('timeout', 30)
-        self._send_request(request_id, action, request)
-        return self._receive_response(request_id, timeout)
+        response = self._add_response(request_id)
+        if self._exception_info:
+            self._remove_response(request_id)
+            raise self._error('Connection has been closed.')
+        try:
+            self._send_request(request_id, action, request)
+        except self._error:
+            self._remove_response(request_id)
+            raise
+        return self._receive_response(request_id, response, timeout)
 
 
 class WebsocketTransportError(TransportError):
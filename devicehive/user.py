@@ -33,6 +33,7 @@ class User(object):
     PASSWORD_KEY = 'password'
     NETWORKS_KEY = 'networks'
     ALL_DEVICE_TYPES_KEY = 'allDeviceTypesAvailable'
+    CACHE_KEY = 'user'
     ADMINISTRATOR_ROLE = 0
     CLIENT_ROLE = 1
     ACTIVE_STATUS = 0
@@ -106,12 +107,15 @@ class User(object):
         user = auth_api_request.execute('Current user get failure.')
         self._init(user)
 
-    def get(self, user_id):
+    def _get(self, user_id):
         auth_api_request = AuthApiRequest(self._api)
         auth_api_request.url('user/{userId}', userId=user_id)
         auth_api_request.action('user/get')
         auth_api_request.response_key('user')
-        user = auth_api_request.execute('User get failure.')
+        return auth_api_request.execute('User get failure.')
+
+    def get(self, user_id):
+        user = self._api.cache_call(self.CACHE_KEY, user_id, self._get, user_id)
         self._init(user)
 
     def save(self):
@@ -125,6 +129,7 @@ class User(object):
         auth_api_request.action('user/update')
         auth_api_request.set('user', user, True)
         auth_api_request.execute('User save failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
 
     def update_password(self, password):
         self._ensure_exists()
@@ -135,6 +140,7 @@ class User(object):
         auth_api_request.action('user/update')
         auth_api_request.set('user', user, True)
         auth_api_request.execute('User password update failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
 
     def remove(self):
         self._ensure_exists()
@@ -143,6 +149,7 @@ class User(object):
         auth_api_request.url('user/{userId}', userId=self._id)
         auth_api_request.action('user/delete')
         auth_api_request.execute('User remove failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
         self._id = None
         self._login = None
         self._last_login = None
@@ -198,6 +205,7 @@ class User(object):
         auth_api_request.url('user/{userId}/devicetype/all', userId=self._id)
         auth_api_request.action('user/allowAllDeviceTypes')
         auth_api_request.execute('Assign all device types failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
         self._all_device_types_available = True
 
     def disallow_all_device_types(self):
@@ -208,6 +216,7 @@ class User(object):
         auth_api_request.url('user/{userId}/devicetype/all', userId=self._id)
         auth_api_request.action('user/disallowAllDeviceTypes')
         auth_api_request.execute('Unassign device type failure.')
+        self._api.invalidate_cache(self.CACHE_KEY, self._id)
         self._all_device_types_available = False
 
     def assign_device_type(self, device_type_id):
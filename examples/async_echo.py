@@ -0,0 +1,42 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive import AsyncHandler
+from devicehive import AsyncDeviceHive
+import asyncio
+
+
+class AsyncEchoHandler(AsyncHandler):
+
+    def __init__(self, api, device_id='example-async-echo-device'):
+        super(AsyncEchoHandler, self).__init__(api)
+        self._device_id = device_id
+        self._device = None
+
+    async def handle_connect(self):
+        self._device = await self.api.put_device(self._device_id)
+        await self._device.subscribe_insert_commands()
+
+    async def handle_command_insert(self, command):
+        await self._device.send_notification(command.command,
+                                             parameters=command.parameters)
+
+
+url = 'ws://playground.devicehive.com/api/websocket'
+refresh_token = 'PUT_YOUR_REFRESH_TOKEN_HERE'
+dh = AsyncDeviceHive(AsyncEchoHandler)
+loop = asyncio.get_event_loop()
+loop.run_until_complete(dh.connect(url, refresh_token=refresh_token))
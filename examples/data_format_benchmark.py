@@ -0,0 +1,69 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive.data_formats.json_data_format import JsonDataFormat
+from devicehive.data_formats.msgpack_data_format import MsgPackDataFormat
+import random
+import timeit
+
+
+NUM_NOTIFICATIONS = 10000
+NUM_REPEATS = 5
+
+
+def notification_event(notification_id):
+    parameters = {'temperature': random.uniform(-40, 40),
+                  'humidity': random.uniform(0, 100),
+                  'pressure': random.uniform(950, 1050),
+                  'voltage': random.randint(0, 4095),
+                  'samples': [random.randint(0, 4095) for _ in range(16)]}
+    return {'action': 'notification/insert',
+            'subscriptionId': 1,
+            'notification': {'id': notification_id,
+                             'deviceId': 'sensor-%d' % (notification_id % 100),
+                             'networkId': 1,
+                             'deviceTypeId': 1,
+                             'notification': 'reading',
+                             'timestamp': '2018-01-01T00:00:00.000',
+                             'parameters': parameters}}
+
+
+def benchmark(name, data_format, events):
+    encoded_events = [data_format.encode(event) for event in events]
+    size = sum(len(encoded_event) for encoded_event in encoded_events)
+    encode_time = min(timeit.repeat(
+        lambda: [data_format.encode(event) for event in events],
+        number=1, repeat=NUM_REPEATS))
+    decode_time = min(timeit.repeat(
+        lambda: [data_format.decode(data) for data in encoded_events],
+        number=1, repeat=NUM_REPEATS))
+    print('%-10s size: %9d bytes, encode: %.3f s, decode: %.3f s' %
+          (name, size, encode_time, decode_time))
+
+
+def main():
+    events = [notification_event(i) for i in range(NUM_NOTIFICATIONS)]
+    print('%d notification events, best of %d runs' % (NUM_NOTIFICATIONS,
+                                                       NUM_REPEATS))
+    benchmark('json', JsonDataFormat('json'), events)
+    json_data_format = JsonDataFormat()
+    if json_data_format.backend != 'json':
+        benchmark(json_data_format.backend, json_data_format, events)
+    benchmark('msgpack', MsgPackDataFormat(), events)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive import Handler
+from devicehive.notification import Notification
+import devicehive.api_handler
+import gc
+import sys
+import time
+import tracemalloc
+
+
+NUM_NOTIFICATIONS = 1000000
+
+
+class DictNotification(object):
+    """Notification with an instance dict, as before __slots__."""
+
+    def __init__(self, notification):
+        self._device_id = notification[Notification.DEVICE_ID_KEY]
+        self._id = notification[Notification.ID_KEY]
+        self._notification = notification[Notification.NOTIFICATION_KEY]
+        self._parameters = notification[Notification.PARAMETERS_KEY]
+        self._timestamp = notification[Notification.TIMESTAMP_KEY]
+
+    @property
+    def device_id(self):
+        return self._device_id
+
+    @property
+    def notification(self):
+        return self._notification
+
+
+class BufferHandler(Handler):
+    """Handler that buffers every received notification."""
+
+    def __init__(self, api):
+        super(BufferHandler, self).__init__(api)
+        self.notifications = []
+
+    def handle_notification(self, notification):
+        self.notifications.append(notification)
+
+
+def notification_event(notification_id):
+    return {'action': 'notification/insert',
+            'subscriptionId': 1,
+            'notification': {'id': notification_id,
+                             'deviceId': 'sensor-%d' % (notification_id % 100),
+                             'notification': 'reading',
+                             'timestamp': '2018-01-01T00:00:00.000',
+                             'parameters': {'value': notification_id}}}
+
+
+def benchmark(name, notification_class):
+    devicehive.api_handler.Notification = notification_class
+    api_handler = devicehive.api_handler.ApiHandler(
+        None, {'access_token': 'access_token'}, BufferHandler, (), {}, False)
+    handler = api_handler.handler
+    events = [notification_event(i) for i in range(NUM_NOTIFICATIONS)]
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.time()
+    for event in events:
+        api_handler.handle_event(event)
+    handle_time = time.time() - start_time
+    size, peak = tracemalloc.get_traced_memory()
+    num_blocks = sum(statistic.count for statistic in
+                     tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    notification = handler.notifications[0]
+    object_size = sys.getsizeof(notification)
+    if hasattr(notification, '__dict__'):
+        object_size += sys.getsizeof(notification.__dict__)
+    print('%-10s buffered: %7.1f MiB, peak: %7.1f MiB, blocks: %8d, '
+          'object: %3d bytes, time: %.2f s' %
+          (name, size / 1048576.0, peak / 1048576.0, num_blocks,
+           object_size, handle_time))
+
+
+def main():
+    print('%d buffered notifications' % NUM_NOTIFICATIONS)
+    benchmark('dict', DictNotification)
+    benchmark('slots', Notification)
+
+
+if __name__ == '__main__':
+    main()
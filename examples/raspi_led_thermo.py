@@ -104,15 +104,20 @@ class SampleHandler(Handler):
         t.setDaemon(True)
         t.start()
 
+    @Handler.on_command('led/on')
+    def handle_led_on(self, command):
+        GPIO.output(LED_PIN, 1)
+        command.status = "Ok"
+        command.save()
+
+    @Handler.on_command('led/off')
+    def handle_led_off(self, command):
+        GPIO.output(LED_PIN, 0)
+        command.status = "Ok"
+        command.save()
+
     def handle_command_insert(self, command):
-        if command.command == 'led/on':
-            GPIO.output(LED_PIN, 1)
-            command.status = "Ok"
-        elif command.command == 'led/off':
-            GPIO.output(LED_PIN, 0)
-            command.status = "Ok"
-        else:
-            command.status = "Unknown command"
+        command.status = "Unknown command"
         command.save()
 
 
@@ -0,0 +1,53 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+from devicehive import Handler
+from devicehive import DeviceHiveSupervisor
+
+
+class EchoGatewayHandler(Handler):
+
+    def __init__(self, api, device_ids):
+        super(EchoGatewayHandler, self).__init__(api)
+        self._device_handlers = {}
+        self._device_ids = device_ids
+
+    def handle_connect(self):
+        self.handle_device_ids(self._device_ids)
+
+    def handle_device_ids(self, device_ids, removed_device_ids=()):
+        removed_device_ids = [device_id for device_id in removed_device_ids
+                              if self._device_handlers.pop(device_id, None)]
+        if removed_device_ids:
+            self.api.gateway.unregister(removed_device_ids)
+        device_handlers = {device_id: self for device_id in device_ids
+                           if device_id not in self._device_handlers}
+        self._device_handlers.update(device_handlers)
+        if device_handlers:
+            self.api.gateway.register(device_handlers)
+
+    def handle_command_insert(self, command):
+        self.api.send_notification(command.device_id, command.command,
+                                   parameters=command.parameters)
+
+
+if __name__ == '__main__':
+    url = 'ws://playground.devicehive.com/api/websocket'
+    refresh_token = 'PUT_YOUR_REFRESH_TOKEN_HERE'
+    device_ids = ['example-supervisor-device-%s' % i for i in range(100)]
+    supervisor = DeviceHiveSupervisor(EchoGatewayHandler)
+    supervisor.run(url, device_ids, num_workers=4, respawn=True,
+                   refresh_token=refresh_token)
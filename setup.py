@@ -34,7 +34,9 @@ setup(name='devicehive',
       packages=['devicehive', 'devicehive.data_formats', 'devicehive.handlers',
                 'devicehive.transports'],
       install_requires=['websocket-client>=0.44.0', 'requests>=2.18.1',
-                        'six>=1.10.0'],
+                        'six>=1.10.0', 'futures>=3.1.1;python_version<"3.2"'],
+      extras_require={'async': ['aiohttp>=3.0.0;python_version>="3.5"'],
+                      'msgpack': ['msgpack>=0.5.2']},
       classifiers=[
           'Development Status :: 5 - Production/Stable',
           'Environment :: Console',
@@ -15,12 +15,17 @@
 
 
 import pytest
+import sys
 import six
 from tests.test import Test
 
 
 USER_ROLES = ['admin', 'client']
 
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.append('test_api_async.py')
+
 
 def pytest_addoption(parser):
     parser.addoption('--transport-urls', action='store',
@@ -21,6 +21,7 @@ from six.moves import range as six_range
 from collections import defaultdict
 from devicehive import Handler
 from devicehive import DeviceHiveApi
+from devicehive import ShardedDeviceHiveApi
 from devicehive import DeviceHive
 
 
@@ -138,6 +139,14 @@ class Test(object):
     def entity_ids(self):
         return self._entity_ids
 
+    @property
+    def transport_url(self):
+        return self._transport_url
+
+    @property
+    def credentials(self):
+        return dict(self._credentials)
+
     @property
     def transport_name(self):
         return self._transport_name
@@ -205,19 +214,25 @@ class Test(object):
             return
         pytest.skip('Not implemented for "login/password" credentials.')
 
-    def device_hive_api(self):
-        return DeviceHiveApi(self._transport_url, **self._credentials)
+    def device_hive_api(self, **options):
+        options.update(self._credentials)
+        return DeviceHiveApi(self._transport_url, **options)
+
+    def sharded_device_hive_api(self, num_shards, **options):
+        options.update(self._credentials)
+        return ShardedDeviceHiveApi(self._transport_url, num_shards, **options)
 
     def run(self, handle_connect, handle_command_insert=None,
             handle_command_update=None, handle_notification=None,
-            handle_timeout=60):
+            handle_timeout=60, **options):
         handler_kwargs = {'handle_connect': handle_connect,
                           'handle_command_insert': handle_command_insert,
                           'handle_command_update': handle_command_update,
                           'handle_notification': handle_notification}
         device_hive = DeviceHive(TestHandler, **handler_kwargs)
+        options.update(self._credentials)
         device_hive.connect(self._transport_url, transport_keep_alive=False,
-                            **self._credentials)
+                            **options)
 
         start_time = time.time()
         while time.time() - handle_timeout < start_time:
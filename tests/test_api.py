@@ -15,8 +15,16 @@
 
 
 from six import string_types
-from devicehive import ApiResponseError, SubscriptionError
+from devicehive import ApiResponseError, SubscriptionError, ApiPipelineError
+from devicehive import ApiCommandFuturesError
 from devicehive.user import User
+from devicehive.api_outbox import ApiOutbox
+from devicehive.api_backfill import ApiBackfill
+import threading
+import tempfile
+import shutil
+import time
+import os
 
 
 def test_get_info(test):
@@ -32,6 +40,101 @@ def test_get_info(test):
     assert info['rest_server_url'] is None
 
 
+def test_persistent_session(test):
+    with test.device_hive_api(persistent=True) as device_hive_api:
+        info = device_hive_api.get_info()
+        assert isinstance(info['server_timestamp'], string_types)
+        transport = device_hive_api._device_hive.transport
+        device_hive_api.get_info()
+        assert device_hive_api._device_hive.transport is transport
+        device_hive_api.disconnect()
+        info = device_hive_api.get_info()
+        assert isinstance(info['server_timestamp'], string_types)
+        assert device_hive_api._device_hive.transport is not transport
+    assert not transport.connected
+
+
+def test_send_command_future(test):
+    device_id = test.generate_id('s-c-f', test.DEVICE_ENTITY)
+    with test.device_hive_api(persistent=True) as device_hive_api:
+        device = device_hive_api.put_device(device_id)
+        future = device_hive_api.send_command_future(device_id, 's-c-f')
+        command = device_hive_api.list_commands(device_id)[0]
+        command.status = 'status'
+        command.result = {'result_key': 'result_value'}
+        command.save()
+        command = future.result(10)
+        assert command.status == 'status'
+        assert command.result == {'result_key': 'result_value'}
+        try:
+            device_hive_api.send_command(device_id, 's-c-f', wait=True,
+                                         timeout=0.5)
+            assert False
+        except ApiCommandFuturesError:
+            pass
+        device.remove()
+
+
+def test_sharded_device_hive_api(test):
+    _, device_ids = test.generate_ids('s-d-h-a', test.DEVICE_ENTITY, 4)
+    with test.sharded_device_hive_api(2) as device_hive_api:
+        assert device_hive_api.num_shards == 2
+        devices = [device_hive_api.put_device(device_id)
+                   for device_id in device_ids]
+        notifications = [{'deviceId': device_id, 'notification': device_id}
+                         for device_id in device_ids]
+        futures = device_hive_api.send_bulk_notifications(notifications)
+        assert [future.result().device_id for future in futures] == \
+            device_ids
+        stats = device_hive_api.stats
+        assert sum(shard['calls'] for shard in stats) >= len(device_ids)
+        assert all(shard['errors'] == 0 for shard in stats)
+        [device.remove() for device in devices]
+
+
+def test_outbox(test):
+    device_id = test.generate_id('o', test.DEVICE_ENTITY)
+    notification_names = ['%s-%s' % (device_id, i) for i in range(5)]
+    outbox_dir = tempfile.mkdtemp()
+    outbox_path = os.path.join(outbox_dir, 'outbox.db')
+    outbox = ApiOutbox(outbox_path, max_size=5, batch_size=2)
+    requests = [{'device_id': device_id, 'notification_name': name,
+                 'parameters': None, 'timestamp': None}
+                for name in notification_names]
+    requests.insert(2, {'device_id': device_id})
+    for request in requests:
+        if 'timestamp' in request:
+            request['timestamp'] = outbox.timestamp()
+            time.sleep(0.01)
+        outbox.put(ApiOutbox.NOTIFICATION_ACTION, request)
+    assert len(outbox) == 5
+    assert outbox.num_dropped == 1
+    batch = outbox.batch()
+    assert [request for _, _, request in batch] == requests[1:3]
+    outbox.remove([batch[0][0]])
+    assert len(outbox) == 4
+    outbox.close()
+    device = test.device_hive_api().put_device(device_id)
+    try:
+        with test.device_hive_api(persistent=True, outbox_path=outbox_path,
+                                  outbox_batch_size=2) as device_hive_api:
+            device_hive_api.get_info()
+            outbox = device_hive_api._device_hive.handler.api.outbox
+            start_time = time.time()
+            while len(outbox) and time.time() - start_time < 10:
+                time.sleep(0.1)
+            assert not len(outbox)
+            assert outbox.num_poisoned == 1
+            notifications = device_hive_api.list_notifications(
+                device_id, sort_field='timestamp', sort_order='ASC')
+            assert [notification.notification
+                    for notification in notifications] == \
+                notification_names[2:]
+    finally:
+        device.remove()
+        shutil.rmtree(outbox_dir)
+
+
 def test_get_cluster_info(test):
     device_hive_api = test.device_hive_api()
     cluster_info = device_hive_api.get_cluster_info()
@@ -484,6 +587,158 @@ def test_unsubscribe_notifications(test):
     test.run(handle_connect)
 
 
+def test_subscription_coalescing(test):
+    test.only_admin_implementation()
+    test.only_http_implementation()
+
+    def group_ids(handler):
+        groups = handler.api.transport._subscription_groups
+        return set(group['id'] for group in groups.values())
+
+    def send_data(handler, devices):
+        for device in devices:
+            notification = device.send_notification(device.id)
+            handler.data['notification_ids'][device.id].append(notification.id)
+
+    def handle_connect(handler):
+        network_name = test.generate_id('s-c', test.NETWORK_ENTITY)
+        network_description = '%s-description' % network_name
+        network = handler.api.create_network(network_name, network_description)
+        _, device_ids = test.generate_ids('s-c', test.DEVICE_ENTITY, 2)
+        devices = [handler.api.put_device(device_id, network_id=network.id)
+                   for device_id in device_ids]
+        subscriptions = [device.subscribe_notifications()
+                         for device in devices]
+        assert len(group_ids(handler)) == 1
+        handler.data['network'] = network
+        handler.data['devices'] = devices
+        handler.data['subscriptions'] = subscriptions
+        handler.data['notification_ids'] = {device_id: []
+                                            for device_id in device_ids}
+        handler.data['unsubscribed'] = False
+        send_data(handler, devices)
+
+    def handle_notification(handler, notification):
+        notification_ids = handler.data['notification_ids']
+        assert notification.id in notification_ids[notification.device_id]
+        notification_ids[notification.device_id].remove(notification.id)
+        if any(notification_ids.values()):
+            return
+        devices = handler.data['devices']
+        subscriptions = handler.data['subscriptions']
+        if not handler.data['unsubscribed']:
+            handler.data['unsubscribed'] = True
+            subscriptions[0].remove()
+            assert len(group_ids(handler)) == 1
+            devices[0].send_notification(devices[0].id)
+            send_data(handler, devices[1:])
+            return
+        subscriptions[1].remove()
+        assert not group_ids(handler)
+        [device.remove() for device in devices]
+        handler.data['network'].remove()
+        handler.disconnect()
+
+    test.run(handle_connect, handle_notification=handle_notification,
+             subscription_coalescing=True)
+
+
+def test_dispatch_workers(test):
+
+    def handle_connect(handler):
+        _, device_ids = test.generate_ids('d-w', test.DEVICE_ENTITY, 2)
+        handler.data['devices'] = [handler.api.put_device(device_id)
+                                   for device_id in device_ids]
+        handler.data['subscriptions'] = [
+            device.subscribe_notifications()
+            for device in handler.data['devices']]
+        handler.data['notification_ids'] = {device_id: []
+                                            for device_id in device_ids}
+        for i in range(3):
+            [device.send_notification('d-w-%s' % i)
+             for device in handler.data['devices']]
+
+    def handle_notification(handler, notification):
+        notification_ids = handler.data['notification_ids']
+        notification_ids[notification.device_id].append(notification.id)
+        if sum(map(len, notification_ids.values())) < 6:
+            return
+        for device_notification_ids in notification_ids.values():
+            assert device_notification_ids == sorted(device_notification_ids)
+        dispatcher = handler.api.transport.handler.dispatcher
+        assert dispatcher.num_workers == 4
+        assert sum(shard['processed'] for shard in dispatcher.stats) >= 5
+        [subscription.remove()
+         for subscription in handler.data['subscriptions']]
+        [device.remove() for device in handler.data['devices']]
+        handler.disconnect()
+
+    test.run(handle_connect, handle_notification=handle_notification,
+             dispatch_workers=4)
+
+
+def test_handler_routes(test):
+
+    def handle_routed_notification(handler, notification):
+        handler.data['routed'].append(notification.notification)
+        if len(handler.data['routed']) < 2:
+            return
+        assert sorted(handler.data['routed']) == ['h-r-a', 'h-r-b']
+        handler.data['subscription'].remove()
+        handler.data['device'].remove()
+        handler.disconnect()
+
+    def handle_connect(handler):
+        device_id = test.generate_id('h-r', test.DEVICE_ENTITY)
+        handler.data['device'] = handler.api.put_device(device_id)
+        handler.data['routed'] = []
+        handler.router.add('notification/insert', 'h-r-*',
+                           lambda notification: handle_routed_notification(
+                               handler, notification))
+        handler.data['subscription'] = handler.data[
+            'device'].subscribe_notifications()
+        for name in ('unrouted', 'h-r-a', 'h-r-b'):
+            handler.data['device'].send_notification(name)
+
+    def handle_notification(handler, notification):
+        assert notification.notification == 'unrouted'
+
+    test.run(handle_connect, handle_notification=handle_notification)
+
+
+def test_gateway(test):
+
+    class DeviceHandler(object):
+
+        def __init__(self, handler):
+            self._handler = handler
+
+        def handle_command_insert(self, command):
+            command_ids = self._handler.data['command_ids']
+            command_ids.remove(command.id)
+            if command_ids:
+                return
+            gateway = self._handler.api.gateway
+            assert gateway.stats['commands'] == 3
+            gateway.subscription.remove()
+            [device.remove() for device in gateway.devices.values()]
+            self._handler.disconnect()
+
+    def handle_connect(handler):
+        _, device_ids = test.generate_ids('g', test.DEVICE_ENTITY, 3)
+        handler.api.gateway.register({device_id: DeviceHandler(handler)
+                                      for device_id in device_ids}, window=2)
+        assert sorted(handler.api.gateway.devices) == sorted(device_ids)
+        handler.data['command_ids'] = [
+            handler.api.send_command(device_id, 'g-command').id
+            for device_id in device_ids]
+
+    def handle_command_insert(handler, command):
+        assert False
+
+    test.run(handle_connect, handle_command_insert=handle_command_insert)
+
+
 def test_list_devices(test):
     device_hive_api = test.device_hive_api()
     test_id, device_ids = test.generate_ids('l-d', test.DEVICE_ENTITY, 2)
@@ -570,6 +825,136 @@ def test_put_device(test):
     device.remove()
 
 
+def test_pipeline(test):
+
+    def handle_connect(handler):
+        device_id = test.generate_id('p', test.DEVICE_ENTITY)
+        device = handler.api.put_device(device_id)
+        notification_names = ['%s-name-%s' % (device_id, i) for i in range(10)]
+        with handler.api.pipeline(4) as pipeline:
+            assert pipeline.window == 4
+            futures = [pipeline.submit('send_notification', device_id,
+                                       notification_name)
+                       for notification_name in notification_names]
+        notifications = [future.result() for future in futures]
+        assert [notification.notification
+                for notification in notifications] == notification_names
+        assert len(set(notification.id for notification in notifications)) == \
+            len(notification_names)
+        try:
+            pipeline.submit('send_notification', device_id,
+                            notification_names[0])
+            assert False
+        except ApiPipelineError:
+            pass
+        device.remove()
+
+    test.run(handle_connect)
+
+
+def test_send_bulk_notifications(test):
+
+    def handle_connect(handler):
+        _, device_ids = test.generate_ids('s-b-n', test.DEVICE_ENTITY, 2)
+        devices = [handler.api.put_device(device_id)
+                   for device_id in device_ids]
+        parameters = {'parameters_key': 'parameters_value'}
+        notifications = [{'deviceId': device_ids[i % 2],
+                          'notification': '%s-name-%s' % (device_ids[0], i),
+                          'parameters': parameters} for i in range(10)]
+        notifications.append({'deviceId': test.generate_id('s-b-n'),
+                              'notification': 'unknown'})
+        futures = handler.api.send_bulk_notifications(notifications, 4)
+        assert len(futures) == len(notifications)
+        for future, notification in zip(futures[:-1], notifications):
+            result = future.result()
+            assert result.device_id == notification['deviceId']
+            assert result.notification == notification['notification']
+            assert result.parameters == parameters
+            assert isinstance(result.id, int)
+        assert isinstance(futures[-1].exception(), ApiResponseError)
+        futures = devices[0].send_notifications(notifications[:4])
+        assert [future.result().device_id for future in futures] == \
+            [device_ids[0]] * 4
+        [device.remove() for device in devices]
+
+    test.run(handle_connect)
+
+
+def test_notification_publisher(test):
+
+    def handle_connect(handler):
+        device_id = test.generate_id('n-p', test.DEVICE_ENTITY)
+        device = handler.api.put_device(device_id)
+        with handler.api.notification_publisher(60, 3) as publisher:
+            for value in (3, 1, 2):
+                publisher.publish(device_id, 'temperature', {'value': value})
+            publisher.publish(device_id, 'status', 'on')
+        notifications = device.list_notifications()
+        assert len(notifications) == 2
+        parameters = {notification.notification: notification.parameters
+                      for notification in notifications}
+        assert parameters['temperature']['count'] == 3
+        assert parameters['temperature']['parameters']['value'] == {
+            'min': 1, 'max': 3, 'mean': 2.0, 'last': 2}
+        assert parameters['status']['parameters']['value'] == {'last': 'on'}
+        assert publisher.stats['notifications'] == 2
+        device.remove()
+
+    test.run(handle_connect)
+
+
+def test_backfill_notifications(test):
+
+    def handle_connect(handler):
+        _, device_ids = test.generate_ids('b-n', test.DEVICE_ENTITY, 2)
+        devices = [handler.api.put_device(device_id)
+                   for device_id in device_ids]
+        start = handler.api.get_info()['server_timestamp']
+        notifications = [devices[i % 2].send_notification('b-n-%s' % i)
+                         for i in range(10)]
+        end = handler.api.get_info()['server_timestamp']
+        ids = [notification.id for notification in notifications]
+        for num_shards, concurrency in ((1, 1), (3, 2), (20, 4)):
+            backfill = handler.api.backfill_notifications(
+                device_ids, start, end, num_shards=num_shards,
+                concurrency=concurrency, page_size=3)
+            notifications = list(backfill)
+            assert sorted(notification.id
+                          for notification in notifications) == ids
+            timestamps = [notification.timestamp
+                          for notification in notifications]
+            assert timestamps == sorted(timestamps)
+        lock = threading.Lock()
+        calls = {'in_flight': 0, 'max_in_flight': 0}
+
+        def list_notifications(**kwargs):
+            with lock:
+                calls['in_flight'] += 1
+                calls['max_in_flight'] = max(calls['max_in_flight'],
+                                             calls['in_flight'])
+            try:
+                time.sleep(0.1)
+                return handler.api.list_notifications(**kwargs)
+            finally:
+                with lock:
+                    calls['in_flight'] -= 1
+
+        backfill = ApiBackfill(list_notifications, device_ids[0], start, end,
+                               num_shards=16, concurrency=8)
+        notifications = list(backfill)
+        assert [notification.id for notification in notifications] == ids[::2]
+        assert calls['max_in_flight'] == 8
+        backfill = handler.api.backfill_notifications(device_ids[0], start,
+                                                      end, notification='b-n-0')
+        sink = []
+        assert backfill.run(sink.append) == 1
+        assert sink[0].id == ids[0]
+        [device.remove() for device in devices]
+
+    test.run(handle_connect)
+
+
 def test_list_networks(test):
     test.only_admin_implementation()
     device_hive_api = test.device_hive_api()
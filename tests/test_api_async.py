@@ -0,0 +1,107 @@
+# Copyright (C) 2018 DataArt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import asyncio
+import pytest
+from devicehive import AsyncHandler
+from devicehive import AsyncDeviceHive
+
+
+class AsyncTestHandler(AsyncHandler):
+    """Async test handler class."""
+
+    def __init__(self, api, handle_connect, handle_notification):
+        super(AsyncTestHandler, self).__init__(api)
+        self._handle_connect = handle_connect
+        self._handle_notification = handle_notification
+        self.data = {}
+
+    async def handle_connect(self):
+        await self._handle_connect(self)
+        if not self._handle_notification:
+            self.api.disconnect()
+
+    async def handle_notification(self, notification):
+        await self._handle_notification(self, notification)
+
+
+class RoutedAsyncTestHandler(AsyncTestHandler):
+    """Routed async test handler class."""
+
+    @AsyncHandler.on_notification('a-s-n-routed-*')
+    async def handle_routed_notification(self, notification):
+        self.data['notifications'].append('routed')
+
+
+def run(test, handle_connect, handle_notification=None, handle_timeout=60,
+        handler_class=AsyncTestHandler, **options):
+    test.only_websocket_implementation()
+    options.update(test.credentials)
+    device_hive = AsyncDeviceHive(handler_class, handle_connect,
+                                  handle_notification)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(asyncio.wait_for(
+            device_hive.connect(test.transport_url, **options),
+            handle_timeout))
+    finally:
+        loop.close()
+
+
+def test_get_info(test):
+
+    async def handle_connect(handler):
+        info = await handler.api.get_info()
+        assert isinstance(info['server_timestamp'], str)
+
+    run(test, handle_connect)
+
+
+def test_subscribe_notifications(test):
+
+    async def handle_connect(handler):
+        device_id = test.generate_id('a-s-n', test.DEVICE_ENTITY)
+        handler.data['device'] = await handler.api.put_device(device_id)
+        handler.data['subscription'] = \
+            await handler.api.subscribe_notifications(device_id)
+        handler.data['notifications'] = []
+        for name in ('a-s-n-routed-0', 'a-s-n'):
+            await handler.api.send_notification(device_id, name)
+
+    async def handle_notification(handler, notification):
+        handler.data['notifications'].append(notification.notification)
+        assert handler.data['notifications'] == ['routed', 'a-s-n']
+        await handler.data['subscription'].remove()
+        await handler.data['device'].remove()
+        handler.api.disconnect()
+
+    run(test, handle_connect, handle_notification,
+        handler_class=RoutedAsyncTestHandler)
+
+
+def test_unsupported_options(test):
+    from devicehive.transports.async_websocket_transport import \
+        AsyncWebsocketTransportError
+
+    async def handle_connect(handler):
+        pass
+
+    with pytest.raises(AssertionError):
+        run(test, handle_connect, cache_max_size=16)
+    with pytest.raises(AsyncWebsocketTransportError):
+        run(test, handle_connect, events_queue_max_size=1)
+    run(test, handle_connect, events_queue_max_size=1,
+        events_queue_overflow_policy='drop_oldest')
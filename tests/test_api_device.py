@@ -43,6 +43,32 @@ def test_save(test):
         pass
 
 
+def test_cache(test):
+
+    def handle_connect(handler):
+        device_id = test.generate_id('d-c', test.DEVICE_ENTITY)
+        device = handler.api.put_device(device_id)
+        stats = handler.api.cache.stats
+        device_1 = handler.api.get_device(device_id)
+        device_1.data = {'data_key': 'data_value'}
+        device_2 = handler.api.get_device(device_id)
+        assert handler.api.cache.stats['hits'] == stats['hits'] + 2
+        assert not device_2.data
+        device.name = '%s-name' % device_id
+        device.save()
+        device_3 = handler.api.get_device(device_id)
+        assert handler.api.cache.stats['misses'] == stats['misses'] + 1
+        assert device_3.name == device.name
+        device.remove()
+        try:
+            handler.api.get_device(device_id)
+            assert False
+        except ApiResponseError:
+            pass
+
+    test.run(handle_connect, cache_max_size=16)
+
+
 def test_remove(test):
     device_hive_api = test.device_hive_api()
     device_id = test.generate_id('d-r', test.DEVICE_ENTITY)
@@ -499,6 +525,26 @@ def test_list_notifications(test):
             assert api_response_error.code == 403
 
 
+def test_iter_notifications(test):
+    device_hive_api = test.device_hive_api()
+    test_id = test.generate_id('d-i-n', test.DEVICE_ENTITY)
+    device = device_hive_api.put_device(test_id)
+    notification_names = ['%s-name-%s' % (test_id, i) for i in range(7)]
+    for notification_name in notification_names:
+        device.send_notification(notification_name)
+    for page_size, prefetch in ((2, 0), (3, 1), (7, 2), (10, 1)):
+        notifications = device.iter_notifications(sort_field='notification',
+                                                  sort_order='ASC',
+                                                  page_size=page_size,
+                                                  prefetch=prefetch)
+        assert [notification.notification
+                for notification in notifications] == notification_names
+    notifications = iter(device_hive_api.iter_notifications(test_id,
+                                                            page_size=2))
+    assert next(notifications).device_id == test_id
+    device.remove()
+
+
 def test_send_notification(test):
     device_hive_api = test.device_hive_api()
     device_id = test.generate_id('d-s-n', test.DEVICE_ENTITY)